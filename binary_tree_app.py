@@ -2,19 +2,41 @@ import tkinter as tk
 from tkinter import messagebox, Menu, ttk
 
 
+# Engines accepted by BinaryTree(balance=...)
+BALANCE_MODES = (None, "avl")
+
+
 class Node:
     def __init__(self, key):
         self.left = None
         self.right = None
         self.val = key
+        # Only maintained by the AVL engine
+        self.height = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
 
 
 class BinaryTree:
-    def __init__(self):
+    """Binary search tree; balance="avl" keeps it height-balanced with iterative updates.
+
+    The default unbalanced engine degenerates into a list on sorted input. The AVL
+    engine walks down with an explicit path and rebalances back up it, so its height
+    stays under 1.45 log2(n) and no operation recurses.
+    """
+
+    def __init__(self, balance=None):
+        if balance not in BALANCE_MODES:
+            raise ValueError(f"balance must be one of {BALANCE_MODES}")
+        self.balance = balance
         self.root = None
 
     def insert(self, key):
-        if not self.root:
+        if self.balance == "avl":
+            self._avl_insert(key)
+        elif not self.root:
             self.root = Node(key)
         else:
             self._insert(self.root, key)
@@ -32,7 +54,10 @@ class BinaryTree:
                 self._insert(node.right, key)
 
     def delete(self, key):
-        self.root = self._delete(self.root, key)
+        if self.balance == "avl":
+            self._avl_delete(key)
+        else:
+            self.root = self._delete(self.root, key)
 
     def _delete(self, node, key):
         if node is None:
@@ -59,6 +84,109 @@ class BinaryTree:
             node = node.left
         return node
 
+    def contains(self, key):
+        node = self.root
+        while node is not None and node.val != key:
+            node = node.left if key < node.val else node.right
+        return node is not None
+
+    def height(self):
+        """Number of levels, counted iteratively so degenerate trees work too."""
+        height = 0
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return height
+
+    def _avl_insert(self, key):
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.left if key < node.val else node.right
+        if not path:
+            self.root = Node(key)
+            return
+        parent = path[-1]
+        if key < parent.val:
+            parent.left = Node(key)
+        else:
+            parent.right = Node(key)
+        self._rebalance_path(path)
+
+    def _avl_delete(self, key):
+        path = []
+        node = self.root
+        while node is not None and node.val != key:
+            path.append(node)
+            node = node.left if key < node.val else node.right
+        if node is None:
+            return
+        if node.left is not None and node.right is not None:
+            # Take the in-order successor's key and unlink the successor instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.val = successor.val
+            node = successor
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+            return
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._rebalance_path(path)
+
+    def _rebalance_path(self, path):
+        """Restore heights and balance from the deepest node on path up to the root."""
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if depth == 0:
+                    self.root = subtree
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = subtree
+                else:
+                    path[depth - 1].right = subtree
+            elif node.height == old_height:
+                # Nothing above can have changed
+                return
+
+    def _rebalance(self, node):
+        node.height = 1 + max(_height(node.left), _height(node.right))
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right, pivot.left = pivot.left, node
+        node.height = 1 + max(_height(node.left), _height(node.right))
+        pivot.height = 1 + max(_height(pivot.left), _height(pivot.right))
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left, pivot.right = pivot.right, node
+        node.height = 1 + max(_height(node.left), _height(node.right))
+        pivot.height = 1 + max(_height(pivot.left), _height(pivot.right))
+        return pivot
+
     def inorder_traversal(self):
         return self._traverse(self.root, order='inorder')
 
@@ -69,16 +197,30 @@ class BinaryTree:
         return self._traverse(self.root, order='postorder')
 
     def _traverse(self, node, order):
+        """Iterative traversal, so deep unbalanced trees do not hit the recursion limit."""
         res = []
-        if node:
-            if order == 'preorder':
+        stack = []
+        if order == 'inorder':
+            while stack or node:
+                while node:
+                    stack.append(node)
+                    node = node.left
+                node = stack.pop()
                 res.append(node.val)
-            res.extend(self._traverse(node.left, order))
-            if order == 'inorder':
+                node = node.right
+        elif node:
+            # Preorder visits node, left, right; postorder is node, right, left reversed
+            stack.append(node)
+            while stack:
+                node = stack.pop()
                 res.append(node.val)
-            res.extend(self._traverse(node.right, order))
+                first, second = (node.right, node.left) if order == 'preorder' else (node.left, node.right)
+                if first:
+                    stack.append(first)
+                if second:
+                    stack.append(second)
             if order == 'postorder':
-                res.append(node.val)
+                res.reverse()
         return res
 
     def reset(self):
@@ -86,8 +228,8 @@ class BinaryTree:
 
 
 class BinaryTreeApp:
-    def __init__(self, root, main_app):
-        self.tree = BinaryTree()
+    def __init__(self, root, main_app, balance="avl"):
+        self.tree = BinaryTree(balance)
         self.root = root
         self.main_app = main_app  # Store a reference to the main application
         self.root.title("Binary Tree GUI")
@@ -0,0 +1,68 @@
+"""Benchmark sorted against random insertion into the BinaryTree engines.
+
+Run with ``python binary_tree_benchmark.py`` to insert 1M sorted and 1M shuffled keys
+into the AVL engine, then look up and delete a sample, printing the seconds taken
+and the resulting height. The unbalanced engine is run too, up to --unbalanced-limit
+keys, beyond which sorted input makes it quadratic (and recursion-bound).
+"""
+import argparse
+import math
+import random
+import sys
+import time
+
+from binary_tree_app import BinaryTree
+
+# Keys looked up and then deleted after each build
+SAMPLE_SIZE = 10000
+
+
+def run(balance, keys, rng):
+    tree = BinaryTree(balance)
+    started = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    insert_seconds = time.perf_counter() - started
+    height = tree.height()
+
+    sample = rng.sample(keys, min(SAMPLE_SIZE, len(keys)))
+    started = time.perf_counter()
+    assert all(tree.contains(key) for key in sample)
+    lookup_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for key in sample:
+        tree.delete(key)
+    delete_seconds = time.perf_counter() - started
+    return insert_seconds, height, lookup_seconds, delete_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--unbalanced-limit", type=int, default=900,
+                        help="largest input given to the unbalanced engine")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'engine':<11} {'input':<7} {'keys':>10} {'height':>7} {'log2 n':>7} {'insert s':>9} "
+          f"{'lookup us':>10} {'delete us':>10}")
+    for balance in ("avl", None):
+        count = args.count if balance else min(args.count, args.unbalanced_limit)
+        for order in ("sorted", "random"):
+            keys = list(range(count))
+            if order == "random":
+                rng.shuffle(keys)
+            if balance is None:
+                # The recursive engine needs a frame per level on sorted input
+                sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * count + 100))
+            insert_seconds, height, lookup_seconds, delete_seconds = run(balance, keys, rng)
+            sample = min(SAMPLE_SIZE, count)
+            print(f"{balance or 'unbalanced':<11} {order:<7} {count:>10,} {height:>7} {math.log2(count):>7.1f} "
+                  f"{insert_seconds:>9.2f} {lookup_seconds / sample * 1e6:>10.2f} "
+                  f"{delete_seconds / sample * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
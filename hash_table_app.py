@@ -1,11 +1,1226 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+from array import array
+
+import numpy as np
+
+MASK64 = (1 << 64) - 1
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+XXH_PRIME1 = 0x9E3779B185EBCA87
+XXH_PRIME2 = 0xC2B2AE3D27D4EB4F
+XXH_PRIME3 = 0x165667B19E3779F9
+XXH_PRIME4 = 0x85EBCA77C2B2AE63
+XXH_PRIME5 = 0x27D4EB2F165667C5
+# Hash used by HashTableApp unless another name from HASH_FUNCTIONS is given
+DEFAULT_HASH = "builtin"
+# Fewest old buckets moved into the new array by each operation while a resize is in progress
+REHASH_STEP = 4
+# Locks in a StripedHashSet; its capacity is always a multiple of this
+LOCK_STRIPES = 16
+# Persistent set file: a fixed header padded to PERSISTENT_INDEX_OFFSET, then the bucket index of
+# `capacity` little-endian u64 heap offsets (0 = empty), then the append-only key heap. Heap
+# records are (next record offset, hash, key length) followed by the UTF-8 key; buckets chain
+# through `next`, newest first. Header: magic, version, hash name, capacity, count, heap end,
+# garbage bytes, seed.
+PERSISTENT_MAGIC = b"HSET"
+PERSISTENT_VERSION = 1
+PERSISTENT_HEADER = struct.Struct("<4sI8sQQQQ16s")
+PERSISTENT_INDEX_OFFSET = 64
+PERSISTENT_RECORD = struct.Struct("<QQI")
+# (count, heap end, garbage bytes) within the header, rewritten after every change
+PERSISTENT_COUNTS = struct.Struct("<QQQ")
+PERSISTENT_COUNTS_OFFSET = 24
+# Compact automatically once removed records make up this share of the heap
+PERSISTENT_GARBAGE_RATIO = 0.5
+# Cuckoo filter: fingerprint slots per bucket, the fill it is sized for, and relocations tried
+# before an insert gives up and the filter is rebuilt twice as large
+CUCKOO_BUCKET_SLOTS = 4
+CUCKOO_LOAD = 0.9
+CUCKOO_MAX_KICKS = 500
+CUCKOO_ALT_MULTIPLIER = 0x5BD1E995
+# Fingerprints up to this many bits share one int object per value
+CUCKOO_SHARED_FINGERPRINT_BITS = 12
+# FilteredHashSet gives up when its filter would need this many slots per key
+FILTER_MAX_GROWTH = 64
+# Buckets shown in the GUI, in columns of DISPLAY_ROWS
+DISPLAY_BUCKET_LIMIT = 40
+DISPLAY_ROWS = 10
+
+
+def _key_bytes(key):
+    return key.encode("utf-8") if isinstance(key, str) else bytes(key)
+
+
+def _rotl(value, bits):
+    return ((value << bits) | (value >> (64 - bits))) & MASK64
+
+
+def builtin_hash(key, seed=0):
+    """Python's own hash (SipHash for str and bytes), salted with the seed."""
+    return hash((seed, key)) & MASK64
+
+
+def fnv1a_hash(key, seed=0):
+    """64-bit FNV-1a over the UTF-8 bytes, starting from a seeded offset basis."""
+    value = FNV_OFFSET ^ (seed & MASK64)
+    for byte in _key_bytes(key):
+        value = ((value ^ byte) * FNV_PRIME) & MASK64
+    return value
+
+
+def xxhash_style_hash(key, seed=0):
+    """XXH64's short-input path (8-, 4- and 1-byte steps plus avalanche), used for every length."""
+    data = _key_bytes(key)
+    length = len(data)
+    value = ((seed & MASK64) + XXH_PRIME5 + length) & MASK64
+    position = 0
+    while position + 8 <= length:
+        lane = int.from_bytes(data[position:position + 8], "little")
+        lane = (_rotl((lane * XXH_PRIME2) & MASK64, 31) * XXH_PRIME1) & MASK64
+        value = (_rotl(value ^ lane, 27) * XXH_PRIME1 + XXH_PRIME4) & MASK64
+        position += 8
+    if position + 4 <= length:
+        lane = int.from_bytes(data[position:position + 4], "little")
+        value = (_rotl(value ^ (lane * XXH_PRIME1) & MASK64, 23) * XXH_PRIME2 + XXH_PRIME3) & MASK64
+        position += 4
+    for byte in data[position:]:
+        value = (_rotl(value ^ (byte * XXH_PRIME5) & MASK64, 11) * XXH_PRIME1) & MASK64
+    value = ((value ^ (value >> 33)) * XXH_PRIME2) & MASK64
+    value = ((value ^ (value >> 29)) * XXH_PRIME3) & MASK64
+    return value ^ (value >> 32)
+
+
+def siphash_style_hash(key, seed=0):
+    """SipHash-2-4 keyed by the low and high 64 bits of the seed."""
+    data = _key_bytes(key)
+    k0, k1 = seed & MASK64, (seed >> 64) & MASK64
+    v0, v1 = k0 ^ 0x736F6D6570736575, k1 ^ 0x646F72616E646F6D
+    v2, v3 = k0 ^ 0x6C7967656E657261, k1 ^ 0x7465646279746573
+    tail = len(data) & ~7
+    words = [int.from_bytes(data[i:i + 8], "little") for i in range(0, tail, 8)]
+    words.append(int.from_bytes(data[tail:], "little") | ((len(data) & 0xFF) << 56))
+    for rounds, word in [(2, word) for word in words] + [(4, None)]:
+        if word is None:
+            v2 ^= 0xFF
+        else:
+            v3 ^= word
+        for _ in range(rounds):
+            v0 = (v0 + v1) & MASK64
+            v1 = _rotl(v1, 13) ^ v0
+            v0 = _rotl(v0, 32)
+            v2 = (v2 + v3) & MASK64
+            v3 = _rotl(v3, 16) ^ v2
+            v0 = (v0 + v3) & MASK64
+            v3 = _rotl(v3, 21) ^ v0
+            v2 = (v2 + v1) & MASK64
+            v1 = _rotl(v1, 17) ^ v2
+            v2 = _rotl(v2, 32)
+        if word is not None:
+            v0 ^= word
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+def ascii_sum_hash(key, seed=0):
+    """The original character-code sum, kept for comparison: every anagram collides."""
+    return sum(ord(char) for char in key)
+
+
+def _hash_batch(hash_function, seed, keys, capacity):
+    """Hash a whole batch up front; returns (keys, hashes, order, indices).
+
+    order lists key positions grouped by bucket index (hash modulo capacity), stable
+    within a bucket, and indices holds the matching bucket indices, so the following
+    pass walks the bucket array front to back.
+    """
+    keys = list(keys)
+    hashes = [hash_function(key, seed) for key in keys]
+    indices = np.array(hashes, dtype=np.uint64) % np.uint64(capacity)
+    order = np.argsort(indices, kind="stable")
+    return keys, hashes, order.tolist(), indices[order].tolist()
+
+
+HASH_FUNCTIONS = {
+    "builtin": builtin_hash,
+    "fnv1a": fnv1a_hash,
+    "xxhash": xxhash_style_hash,
+    "siphash": siphash_style_hash,
+    "ascii": ascii_sum_hash,
+}
+
+
+class HashSet:
+    """Separate-chaining hash set that keeps its load factor between two bounds.
+
+    The bucket array grows by `growth` when the load passes max_load_factor and shrinks
+    back when it falls below min_load_factor. A resize only allocates the new array; the
+    old buckets are then moved by the operations that follow, at least REHASH_STEP at a
+    time and enough that the move is done before the next resize can trigger, so no
+    single call pays for rehashing the whole table.
+    """
+
+    def __init__(self, capacity=8, max_load_factor=0.75, min_load_factor=0.2, growth=2.0,
+                 hash_function=DEFAULT_HASH, seed=None):
+        if capacity < 1 or growth <= 1 or not 0 <= min_load_factor * growth < max_load_factor:
+            raise ValueError("Need capacity >= 1, growth > 1 and min_load_factor * growth < max_load_factor.")
+        self.min_capacity = capacity
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.growth = growth
+        self.hash_function = HASH_FUNCTIONS[hash_function]
+        # Each set draws its own seed so bucket placement cannot be predicted across instances
+        self.seed = random.getrandbits(128) if seed is None else seed
+        self.buckets = [None] * capacity
+        self._old = None
+        self._next = 0
+        self._step = REHASH_STEP
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        if self._old is not None:
+            for bucket in self._old[self._next:]:
+                yield from bucket or ()
+        for bucket in self.buckets:
+            yield from bucket or ()
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    @property
+    def capacity(self):
+        return len(self.buckets)
+
+    @property
+    def load_factor(self):
+        return self._count / len(self.buckets)
+
+    @property
+    def rehashing(self):
+        return self._old is not None
+
+    def bucket_index(self, key):
+        return self.hash_function(key, self.seed) % len(self.buckets)
+
+    def _slot(self, value):
+        """Return (bucket array, index) of the chain a key hashing to value belongs to right now.
+
+        Old buckets from _next on have not been migrated yet and still own their keys.
+        """
+        old = self._old
+        if old is not None:
+            index = value % len(old)
+            if index >= self._next:
+                return old, index
+        return self.buckets, value % len(self.buckets)
+
+    def contains(self, key):
+        return self.contains_hashed(key, self.hash_function(key, self.seed))
+
+    def contains_hashed(self, key, value):
+        """contains() for a key whose hash_function(key, seed) is already known."""
+        if self._old is not None:
+            self._migrate(self._step)
+        table, index = self._slot(value)
+        bucket = table[index]
+        return bucket is not None and key in bucket
+
+    def add(self, key):
+        """Insert key; returns False if it was already present."""
+        if self._old is not None:
+            self._migrate(self._step)
+        table, index = self._slot(self.hash_function(key, self.seed))
+        bucket = table[index]
+        if bucket is None:
+            table[index] = [key]
+        elif key in bucket:
+            return False
+        else:
+            bucket.append(key)
+        self._count += 1
+        capacity = len(self.buckets)
+        if self._count > self.max_load_factor * capacity:
+            self._resize(max(capacity + 1, int(capacity * self.growth)))
+        return True
+
+    def remove(self, key):
+        """Delete key; returns False if it was not present."""
+        if self._old is not None:
+            self._migrate(self._step)
+        table, index = self._slot(self.hash_function(key, self.seed))
+        bucket = table[index]
+        if bucket is None or key not in bucket:
+            return False
+        bucket.remove(key)
+        if not bucket:
+            table[index] = None
+        self._count -= 1
+        capacity = len(self.buckets)
+        if capacity > self.min_capacity and self._count < self.min_load_factor * capacity:
+            self._resize(max(self.min_capacity, int(capacity / self.growth)))
+        return True
+
+    def add_many(self, keys):
+        """Insert every key in one pass after hashing the batch; returns how many were new."""
+        keys = list(keys)
+        self.rehash_now()
+        capacity = len(self.buckets)
+        while self._count + len(keys) > self.max_load_factor * capacity:
+            capacity = max(capacity + 1, int(capacity * self.growth))
+        if capacity != len(self.buckets):
+            self._resize(capacity)
+            self.rehash_now()
+        keys, _, order, indices = _hash_batch(self.hash_function, self.seed, keys, capacity)
+        buckets = self.buckets
+        added = 0
+        for position, index in zip(order, indices):
+            key = keys[position]
+            bucket = buckets[index]
+            if bucket is None:
+                buckets[index] = [key]
+            elif key in bucket:
+                continue
+            else:
+                bucket.append(key)
+            added += 1
+        self._count += added
+        return added
+
+    def contains_many(self, keys):
+        """Return a numpy boolean array: whether each key, in input order, is present."""
+        self.rehash_now()
+        buckets = self.buckets
+        capacity = len(buckets)
+        keys, _, order, indices = _hash_batch(self.hash_function, self.seed, keys, capacity)
+        found = np.zeros(len(keys), dtype=bool)
+        for position, index in zip(order, indices):
+            bucket = buckets[index]
+            if bucket is not None and keys[position] in bucket:
+                found[position] = True
+        return found
+
+    def remove_many(self, keys):
+        """Delete every key in one pass; returns how many were present."""
+        self.rehash_now()
+        buckets = self.buckets
+        capacity = len(buckets)
+        keys, _, order, indices = _hash_batch(self.hash_function, self.seed, keys, capacity)
+        removed = 0
+        for position, index in zip(order, indices):
+            bucket = buckets[index]
+            if bucket is not None and keys[position] in bucket:
+                bucket.remove(keys[position])
+                if not bucket:
+                    buckets[index] = None
+                removed += 1
+        self._count -= removed
+        while capacity > self.min_capacity and self._count < self.min_load_factor * capacity:
+            capacity = max(self.min_capacity, int(capacity / self.growth))
+        if capacity != len(buckets):
+            self._resize(capacity)
+        return removed
+
+    def clear(self):
+        self.buckets = [None] * self.min_capacity
+        self._old = None
+        self._next = 0
+        self._count = 0
+
+    def rehash_now(self):
+        """Finish any migration in progress, e.g. before inspecting buckets directly."""
+        if self._old is not None:
+            self._migrate(len(self._old))
+
+    def _resize(self, capacity):
+        self.rehash_now()
+        self._old, self._next = self.buckets, 0
+        self.buckets = [None] * capacity
+        # Adds or removes left before the load can leave its bounds again
+        operations = math.floor(self.max_load_factor * capacity) - self._count + 1
+        if capacity > self.min_capacity:
+            operations = min(operations, self._count - math.ceil(self.min_load_factor * capacity) + 1)
+        self._step = max(REHASH_STEP, math.ceil(len(self._old) / max(operations, 1)))
+
+    def _migrate(self, steps):
+        old, buckets = self._old, self.buckets
+        hash_function, seed, capacity = self.hash_function, self.seed, len(buckets)
+        stop = min(self._next + steps, len(old))
+        for index in range(self._next, stop):
+            bucket = old[index]
+            if bucket is not None:
+                for key in bucket:
+                    target = hash_function(key, seed) % capacity
+                    if buckets[target] is None:
+                        buckets[target] = [key]
+                    else:
+                        buckets[target].append(key)
+                old[index] = None
+        self._next = stop
+        if stop == len(old):
+            self._old = None
+
+    def bucket_contents(self, limit=None):
+        """Keys of every bucket (or the first limit buckets) in order, for display.
+
+        Keys still waiting in the old array are shown where they will land, without
+        migrating them, so displaying does not undo incremental rehashing.
+        """
+        contents = [list(bucket or ()) for bucket in self.buckets[:limit]]
+        if self._old is not None:
+            hash_function, seed, capacity = self.hash_function, self.seed, len(self.buckets)
+            for bucket in self._old[self._next:]:
+                for key in bucket or ():
+                    index = hash_function(key, seed) % capacity
+                    if index < len(contents):
+                        contents[index].append(key)
+        return contents
+
+
+class RobinHoodHashSet:
+    """Open-addressing hash set using Robin Hood linear probing.
+
+    Slots are two flat parallel arrays: the full 64-bit hash of each key in an
+    array('Q') and the key itself in a list, with None marking an empty slot, so None
+    cannot be stored. Probing compares cached hashes before keys, and an entry never
+    sits further from its home slot than the key being placed over it. That lets a miss
+    stop early, and deletion shifts the following entries back instead of leaving
+    tombstones. Capacity is a power of two; resizing rehashes from the cached hashes.
+    """
+
+    def __init__(self, capacity=8, max_load_factor=0.9, min_load_factor=0.2,
+                 hash_function=DEFAULT_HASH, seed=None):
+        if not 0 <= min_load_factor * 2 < max_load_factor < 1:
+            raise ValueError("Need min_load_factor * 2 < max_load_factor < 1.")
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.hash_function = HASH_FUNCTIONS[hash_function]
+        self.seed = random.getrandbits(128) if seed is None else seed
+        self.min_capacity = 1 << max(capacity - 1, 1).bit_length()
+        self._allocate(self.min_capacity)
+        self._count = 0
+
+    def _allocate(self, capacity):
+        self.hashes = array("Q", bytes(8 * capacity))
+        self.keys = [None] * capacity
+        self._mask = capacity - 1
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (key for key in self.keys if key is not None)
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    @property
+    def capacity(self):
+        return len(self.keys)
+
+    @property
+    def load_factor(self):
+        return self._count / len(self.keys)
+
+    def bucket_index(self, key):
+        return self.hash_function(key, self.seed) & self._mask
+
+    def _find(self, key, value):
+        keys, hashes, mask = self.keys, self.hashes, self._mask
+        index = value & mask
+        distance = 0
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                return -1
+            slot_hash = hashes[index]
+            if slot_hash == value and (slot_key is key or slot_key == key):
+                return index
+            if (index - slot_hash) & mask < distance:
+                return -1
+            index = (index + 1) & mask
+            distance += 1
+
+    def contains(self, key):
+        return self._find(key, self.hash_function(key, self.seed)) >= 0
+
+    def contains_hashed(self, key, value):
+        """contains() for a key whose hash_function(key, seed) is already known."""
+        return self._find(key, value) >= 0
+
+    def add(self, key):
+        """Insert key; returns False if it was already present."""
+        if key is None:
+            raise ValueError("RobinHoodHashSet cannot store None.")
+        value = self.hash_function(key, self.seed)
+        if self._find(key, value) >= 0:
+            return False
+        if self._count + 1 > self.max_load_factor * len(self.keys):
+            self._resize(len(self.keys) * 2)
+        self._place(key, value)
+        self._count += 1
+        return True
+
+    def _place(self, key, value):
+        """Insert a key known to be absent, displacing entries closer to their home slot."""
+        keys, hashes, mask = self.keys, self.hashes, self._mask
+        index = value & mask
+        distance = 0
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                keys[index], hashes[index] = key, value
+                return
+            slot_distance = (index - hashes[index]) & mask
+            if slot_distance < distance:
+                keys[index], key = key, slot_key
+                hashes[index], value = value, hashes[index]
+                distance = slot_distance
+            index = (index + 1) & mask
+            distance += 1
+
+    def remove(self, key):
+        """Delete key; returns False if it was not present."""
+        index = self._find(key, self.hash_function(key, self.seed))
+        if index < 0:
+            return False
+        self._delete(index)
+        self._shrink()
+        return True
+
+    def _delete(self, index):
+        keys, hashes, mask = self.keys, self.hashes, self._mask
+        # Backward shift: pull each following displaced entry one slot nearer home
+        following = (index + 1) & mask
+        while keys[following] is not None and (following - hashes[following]) & mask:
+            keys[index], hashes[index] = keys[following], hashes[following]
+            index, following = following, (following + 1) & mask
+        keys[index] = None
+        self._count -= 1
+
+    def _shrink(self):
+        capacity = len(self.keys)
+        while capacity > self.min_capacity and self._count < self.min_load_factor * capacity:
+            capacity //= 2
+        if capacity != len(self.keys):
+            self._resize(capacity)
+
+    def add_many(self, keys):
+        """Insert every key after hashing the batch, in home-slot order; returns how many were new."""
+        keys = list(keys)
+        capacity = len(self.keys)
+        while self._count + len(keys) > self.max_load_factor * capacity:
+            capacity *= 2
+        if capacity != len(self.keys):
+            self._resize(capacity)
+        keys, hashes, order, _ = _hash_batch(self.hash_function, self.seed, keys, capacity)
+        find, place = self._find, self._place
+        added = 0
+        for position in order:
+            key, value = keys[position], hashes[position]
+            if key is None:
+                raise ValueError("RobinHoodHashSet cannot store None.")
+            if find(key, value) < 0:
+                place(key, value)
+                added += 1
+                self._count += 1
+        return added
+
+    def contains_many(self, keys):
+        """Return a numpy boolean array: whether each key, in input order, is present."""
+        keys, hashes, order, _ = _hash_batch(self.hash_function, self.seed, keys, len(self.keys))
+        find = self._find
+        found = np.zeros(len(keys), dtype=bool)
+        for position in order:
+            if find(keys[position], hashes[position]) >= 0:
+                found[position] = True
+        return found
+
+    def remove_many(self, keys):
+        """Delete every key in one pass; returns how many were present."""
+        keys, hashes, order, _ = _hash_batch(self.hash_function, self.seed, keys, len(self.keys))
+        find, delete = self._find, self._delete
+        removed = 0
+        for position in order:
+            index = find(keys[position], hashes[position])
+            if index >= 0:
+                delete(index)
+                removed += 1
+        self._shrink()
+        return removed
+
+    def clear(self):
+        self._allocate(self.min_capacity)
+        self._count = 0
+
+    def _resize(self, capacity):
+        entries = [(key, value) for key, value in zip(self.keys, self.hashes) if key is not None]
+        self._allocate(capacity)
+        for key, value in entries:
+            self._place(key, value)
+
+    def bucket_contents(self, limit=None):
+        """The key in every slot (an empty list for a free slot), for display."""
+        return [[] if key is None else [key] for key in self.keys[:limit]]
+
+
+class StripedHashSet:
+    """Thread-safe chaining hash set with one lock per stripe of buckets.
+
+    A key's stripe is its hash modulo the stripe count, and the capacity is always a
+    multiple of that count, so every bucket belongs to one stripe for the life of the
+    set. Buckets are tuples that writers replace whole under their stripe lock, which
+    lets readers look keys up without locking. A resize holds every stripe lock and bumps
+    _version before and after; a reader that overlapped one retries under its stripe lock.
+    """
+
+    def __init__(self, capacity=64, max_load_factor=0.75, min_load_factor=0.2,
+                 hash_function=DEFAULT_HASH, seed=None, stripes=LOCK_STRIPES):
+        if not 0 <= min_load_factor * 2 < max_load_factor:
+            raise ValueError("Need min_load_factor * 2 < max_load_factor.")
+        self.stripes = stripes
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.hash_function = HASH_FUNCTIONS[hash_function]
+        self.seed = random.getrandbits(128) if seed is None else seed
+        self.min_capacity = stripes * max(1, -(-capacity // stripes))
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counts = [0] * stripes
+        self._table = [()] * self.min_capacity
+        # Odd while a resize is swapping tables
+        self._version = 0
+
+    def __len__(self):
+        return sum(self._counts)
+
+    def __iter__(self):
+        """Weakly consistent: walks the table current when iteration starts."""
+        for bucket in self._table:
+            yield from bucket
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    @property
+    def capacity(self):
+        return len(self._table)
+
+    @property
+    def load_factor(self):
+        return len(self) / len(self._table)
+
+    def bucket_index(self, key):
+        return self.hash_function(key, self.seed) % len(self._table)
+
+    def contains(self, key):
+        return self.contains_hashed(key, self.hash_function(key, self.seed))
+
+    def contains_hashed(self, key, value):
+        """contains() for a key whose hash_function(key, seed) is already known."""
+        version = self._version
+        if not version & 1:
+            table = self._table
+            found = key in table[value % len(table)]
+            if self._version == version:
+                return found
+        with self._locks[value % self.stripes]:
+            table = self._table
+            return key in table[value % len(table)]
+
+    def add(self, key):
+        """Insert key; returns False if it was already present."""
+        value = self.hash_function(key, self.seed)
+        stripe = value % self.stripes
+        with self._locks[stripe]:
+            table = self._table
+            index = value % len(table)
+            bucket = table[index]
+            if key in bucket:
+                return False
+            table[index] = bucket + (key,)
+            self._counts[stripe] += 1
+            # Only a stripe over its share of the limit pays for summing every stripe
+            limit = self.max_load_factor * len(table)
+            crowded = self._counts[stripe] > limit / self.stripes and sum(self._counts) > limit
+        if crowded:
+            self._resize(grow=True)
+        return True
+
+    def remove(self, key):
+        """Delete key; returns False if it was not present."""
+        value = self.hash_function(key, self.seed)
+        stripe = value % self.stripes
+        with self._locks[stripe]:
+            table = self._table
+            index = value % len(table)
+            bucket = table[index]
+            if key not in bucket:
+                return False
+            position = bucket.index(key)
+            table[index] = bucket[:position] + bucket[position + 1:]
+            self._counts[stripe] -= 1
+            limit = self.min_load_factor * len(table)
+            sparse = (len(table) > self.min_capacity and self._counts[stripe] < limit / self.stripes
+                      and sum(self._counts) < limit)
+        if sparse:
+            self._resize(grow=False)
+        return True
+
+    def add_many(self, keys):
+        return sum(self.add(key) for key in keys)
+
+    def contains_many(self, keys):
+        keys = list(keys)
+        return np.fromiter((self.contains(key) for key in keys), dtype=bool, count=len(keys))
+
+    def remove_many(self, keys):
+        return sum(self.remove(key) for key in keys)
+
+    def clear(self):
+        self._locked(self._reset)
+
+    def _reset(self):
+        self._version += 1
+        self._table = [()] * self.min_capacity
+        self._counts = [0] * self.stripes
+        self._version += 1
+
+    def _locked(self, function, *args):
+        """Run function holding every stripe lock, taken in a fixed order."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return function(*args)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _resize(self, grow):
+        self._locked(self._rebuild, grow)
+
+    def _rebuild(self, grow):
+        # Another thread may have resized while this one waited for the locks
+        table = self._table
+        count = sum(self._counts)
+        if grow and count > self.max_load_factor * len(table):
+            capacity = len(table) * 2
+        elif not grow and len(table) > self.min_capacity and count < self.min_load_factor * len(table):
+            capacity = len(table) // 2
+        else:
+            return
+        hash_function, seed = self.hash_function, self.seed
+        buckets = [[] for _ in range(capacity)]
+        for bucket in table:
+            for key in bucket:
+                buckets[hash_function(key, seed) % capacity].append(key)
+        self._version += 1
+        self._table = [tuple(bucket) for bucket in buckets]
+        self._version += 1
+
+    def bucket_contents(self, limit=None):
+        return [list(bucket) for bucket in self._table[:limit]]
+
+
+class PersistentHashSet:
+    """Hash set of strings kept in a memory-mapped file (layout above PERSISTENT_HEADER).
+
+    Opening an existing file only reads its header and maps it, so there is no load
+    step; lookups walk bucket chains straight through the mapping. Removal unlinks a
+    record and counts it as garbage; compact() rewrites the file with live keys only,
+    which is also how the bucket index grows. The hash must give the same value in every
+    process, so the per-process salted builtin hash cannot be used; the seed is stored.
+    """
+
+    def __init__(self, path, capacity=1024, max_load_factor=0.75, hash_function="fnv1a", seed=None):
+        if hash_function == "builtin":
+            raise ValueError("The builtin hash changes between processes; choose a stable hash.")
+        self.path = path
+        self.max_load_factor = max_load_factor
+        if not os.path.exists(path):
+            seed = random.getrandbits(128) if seed is None else seed
+            self._create(path, 1 << max(capacity - 1, 1).bit_length(), hash_function, seed)
+        self._file = open(path, "r+b")
+        self._open_map()
+
+    @staticmethod
+    def _create(path, capacity, hash_function, seed):
+        heap_start = PERSISTENT_INDEX_OFFSET + 8 * capacity
+        with open(path, "wb") as stream:
+            stream.write(PERSISTENT_HEADER.pack(PERSISTENT_MAGIC, PERSISTENT_VERSION, hash_function.encode(),
+                                                capacity, 0, heap_start, 0, seed.to_bytes(16, "little")))
+            stream.truncate(heap_start)
+
+    def _open_map(self):
+        if os.fstat(self._file.fileno()).st_size < PERSISTENT_INDEX_OFFSET:
+            self._file.close()
+            raise ValueError(f"{self.path} is too short to be a persistent hash set file.")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, version, name, capacity, self._count, self._heap_end, self._garbage, seed = \
+            PERSISTENT_HEADER.unpack_from(self._map)
+        name = name.rstrip(b"\0").decode("ascii", errors="replace")
+        if (magic != PERSISTENT_MAGIC or version != PERSISTENT_VERSION or name not in HASH_FUNCTIONS or not capacity
+                or capacity & (capacity - 1) or len(self._map) < PERSISTENT_INDEX_OFFSET + 8 * capacity):
+            # The index view does not exist yet, so close() cannot be used
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{self.path} is not a persistent hash set file.")
+        self.hash_name = name
+        self.hash_function = HASH_FUNCTIONS[self.hash_name]
+        self.seed = int.from_bytes(seed, "little")
+        self._mask = capacity - 1
+        self._heap_start = PERSISTENT_INDEX_OFFSET + 8 * capacity
+        self._index = memoryview(self._map)[PERSISTENT_INDEX_OFFSET:self._heap_start].cast("Q")
+
+    def _close_map(self):
+        self._index.release()
+        self._map.close()
+
+    def close(self):
+        if self._file.closed:
+            return
+        if not self._map.closed:
+            self._map.flush()
+            self._close_map()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def flush(self):
+        self._map.flush()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def _records(self):
+        """Yield (offset, hash, key bytes) of every live record, bucket by bucket."""
+        view = self._map
+        for head in self._index:
+            offset = head
+            while offset:
+                following, value, length = PERSISTENT_RECORD.unpack_from(view, offset)
+                start = offset + PERSISTENT_RECORD.size
+                yield offset, value, view[start:start + length]
+                offset = following
+
+    def __iter__(self):
+        return (data.decode("utf-8") for _, _, data in self._records())
+
+    @property
+    def capacity(self):
+        return self._mask + 1
+
+    @property
+    def load_factor(self):
+        return self._count / (self._mask + 1)
+
+    @property
+    def file_size(self):
+        return len(self._map)
+
+    @property
+    def garbage(self):
+        """Heap bytes held by removed records until the next compaction."""
+        return self._garbage
+
+    def bucket_index(self, key):
+        return self.hash_function(key, self.seed) & self._mask
+
+    def _find(self, data, value):
+        """Return (previous record offset or 0, record offset or 0) for data in its chain."""
+        view = self._map
+        previous = 0
+        offset = self._index[value & self._mask]
+        while offset:
+            following, record_hash, length = PERSISTENT_RECORD.unpack_from(view, offset)
+            start = offset + PERSISTENT_RECORD.size
+            if record_hash == value and length == len(data) and view[start:start + length] == data:
+                return previous, offset
+            previous, offset = offset, following
+        return previous, 0
+
+    def contains(self, key):
+        return self._find(key.encode("utf-8"), self.hash_function(key, self.seed))[1] != 0
+
+    def contains_hashed(self, key, value):
+        """contains() for a key whose hash_function(key, seed) is already known."""
+        return self._find(key.encode("utf-8"), value)[1] != 0
+
+    def add(self, key):
+        """Insert key; returns False if it was already present."""
+        data = key.encode("utf-8")
+        value = self.hash_function(key, self.seed)
+        if self._find(data, value)[1]:
+            return False
+        self._append(data, value)
+        self._count += 1
+        self._write_header()
+        if self._count > self.max_load_factor * self.capacity:
+            self.compact(self.capacity * 2)
+        return True
+
+    def _append(self, data, value):
+        size = PERSISTENT_RECORD.size + len(data)
+        if self._heap_end + size > len(self._map):
+            # Grow the file geometrically and map it again
+            self._close_map()
+            self._file.truncate(max(self._heap_end + size, 2 * (self._heap_end + size) - self._heap_start))
+            self._open_map_keeping_state()
+        bucket = value & self._mask
+        PERSISTENT_RECORD.pack_into(self._map, self._heap_end, self._index[bucket], value, len(data))
+        start = self._heap_end + PERSISTENT_RECORD.size
+        self._map[start:start + len(data)] = data
+        # The record is complete before the index points at it
+        self._index[bucket] = self._heap_end
+        self._heap_end += size
+
+    def _open_map_keeping_state(self):
+        count, heap_end, garbage = self._count, self._heap_end, self._garbage
+        self._open_map()
+        self._count, self._heap_end, self._garbage = count, heap_end, garbage
+
+    def remove(self, key):
+        """Delete key; returns False if it was not present."""
+        data = key.encode("utf-8")
+        value = self.hash_function(key, self.seed)
+        previous, offset = self._find(data, value)
+        if not offset:
+            return False
+        following = PERSISTENT_RECORD.unpack_from(self._map, offset)[0]
+        if previous:
+            struct.pack_into("<Q", self._map, previous, following)
+        else:
+            self._index[value & self._mask] = following
+        self._count -= 1
+        self._garbage += PERSISTENT_RECORD.size + len(data)
+        self._write_header()
+        if self._garbage > PERSISTENT_GARBAGE_RATIO * (self._heap_end - self._heap_start):
+            self.compact()
+        return True
+
+    def add_many(self, keys):
+        return sum(self.add(key) for key in keys)
+
+    def contains_many(self, keys):
+        keys = list(keys)
+        return np.fromiter((self.contains(key) for key in keys), dtype=bool, count=len(keys))
+
+    def remove_many(self, keys):
+        return sum(self.remove(key) for key in keys)
+
+    def _write_header(self):
+        PERSISTENT_COUNTS.pack_into(self._map, PERSISTENT_COUNTS_OFFSET, self._count, self._heap_end, self._garbage)
+
+    def compact(self, capacity=None):
+        """Rewrite the file with only live keys, optionally with a new bucket count.
+
+        The new file is built beside the old one and renamed over it, so a crash part
+        way through leaves the old file intact.
+        """
+        capacity = capacity or max(8, 1 << max(int(self._count / self.max_load_factor), 1).bit_length())
+        temporary = self.path + ".compact"
+        self._create(temporary, capacity, self.hash_name, self.seed)
+        fresh = PersistentHashSet(temporary, max_load_factor=self.max_load_factor, hash_function=self.hash_name)
+        live = sum(PERSISTENT_RECORD.size + len(data) for _, _, data in self._records())
+        fresh._close_map()
+        fresh._file.truncate(fresh._heap_start + live)
+        fresh._open_map()
+        for _, value, data in self._records():
+            fresh._append(bytes(data), value)
+        fresh._count = self._count
+        fresh._write_header()
+        fresh.close()
+        self._close_map()
+        self._file.close()
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "r+b")
+        self._open_map()
+
+    def bucket_contents(self, limit=None):
+        contents = []
+        for head in self._index[:limit]:
+            keys = []
+            offset = head
+            while offset:
+                following, _, length = PERSISTENT_RECORD.unpack_from(self._map, offset)
+                start = offset + PERSISTENT_RECORD.size
+                keys.append(self._map[start:start + length].decode("utf-8"))
+                offset = following
+            contents.append(keys)
+        return contents
+
+
+class CuckooFilter:
+    """Approximate membership with deletion: a fingerprint per key in one of two buckets.
+
+    A key's second bucket is its first XOR a hash of its fingerprint, so a fingerprint
+    can be moved between its buckets without the key. With f-bit fingerprints and
+    CUCKOO_BUCKET_SLOTS slots per bucket an absent key matches with probability about
+    2 * slots / 2**f, so f is chosen from the requested false-positive rate.
+    Each bucket is a tuple of its fingerprints, so a probe is one C-level `in` per
+    bucket; packed slots would take less memory but cost more per probe than the
+    hash set lookup the filter is meant to save. hash_function is a name from
+    HASH_FUNCTIONS or the function itself, so the filter can share a hash set's hash
+    and the *_hash methods can reuse one hash value.
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01, hash_function=DEFAULT_HASH, seed=None):
+        bits = max(4, math.ceil(math.log2(2 * CUCKOO_BUCKET_SLOTS / false_positive_rate)))
+        if bits > 32:
+            raise ValueError("false_positive_rate is too small for 32-bit fingerprints.")
+        self.false_positive_rate = false_positive_rate
+        self.fingerprint_bits = bits
+        self.hash_function = hash_function if callable(hash_function) else HASH_FUNCTIONS[hash_function]
+        self.seed = random.getrandbits(128) if seed is None else seed
+        buckets = 1 << (max(1, math.ceil(capacity / (CUCKOO_BUCKET_SLOTS * CUCKOO_LOAD))) - 1).bit_length()
+        self.buckets = [()] * buckets
+        # Small fingerprints are stored as shared int objects rather than one object per key
+        self._fingerprint_objects = list(range(1 << bits)) if bits <= CUCKOO_SHARED_FINGERPRINT_BITS else None
+        self._fingerprint_shift = 64 - bits
+        self._mask = buckets - 1
+        self._rng = random.Random(self.seed)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def slot_count(self):
+        return len(self.buckets) * CUCKOO_BUCKET_SLOTS
+
+    @property
+    def memory_bytes(self):
+        """Bucket list, bucket tuples and fingerprint objects."""
+        size = sys.getsizeof(self.buckets) + sum(sys.getsizeof(bucket) for bucket in self.buckets if bucket)
+        if self._fingerprint_objects is not None:
+            return size + sys.getsizeof(self._fingerprint_objects) + 28 * len(self._fingerprint_objects)
+        return size + 28 * self._count
+
+    def _fingerprint(self, value):
+        """Top fingerprint_bits of a 64-bit hash value; the low bits pick the bucket."""
+        fingerprint = value >> self._fingerprint_shift
+        if self._fingerprint_objects is not None:
+            return self._fingerprint_objects[fingerprint]
+        return fingerprint
+
+    def _alternate(self, bucket, fingerprint):
+        return (bucket ^ fingerprint * CUCKOO_ALT_MULTIPLIER) & self._mask
+
+    def might_contain(self, key):
+        """False means key was definitely never added (or was removed)."""
+        return self.might_contain_hash(self.hash_function(key, self.seed))
+
+    def might_contain_hash(self, value):
+        """might_contain() for a key whose hash_function(key, seed) is value."""
+        buckets, mask = self.buckets, self._mask
+        fingerprint = value >> self._fingerprint_shift
+        # (first ^ f * m) & mask == (value ^ f * m) & mask, as first is value & mask
+        return (fingerprint in buckets[value & mask]
+                or fingerprint in buckets[(value ^ fingerprint * CUCKOO_ALT_MULTIPLIER) & mask])
+
+    def might_contain_many(self, keys):
+        """might_contain for every key: a numpy boolean array in input order."""
+        keys = list(keys)
+        hash_function, seed, probe = self.hash_function, self.seed, self.might_contain_hash
+        return np.fromiter((probe(hash_function(key, seed)) for key in keys), dtype=bool, count=len(keys))
+
+    def add(self, key):
+        """Store key's fingerprint; returns False if the filter is too full to place it.
+
+        After a False return one resident fingerprint may have been evicted, so the
+        filter must be rebuilt from the full key set.
+        """
+        value = self.hash_function(key, self.seed)
+        fingerprint = self._fingerprint(value)
+        first = value & self._mask
+        second = self._alternate(first, fingerprint)
+        buckets = self.buckets
+        for bucket in (first, second):
+            if len(buckets[bucket]) < CUCKOO_BUCKET_SLOTS:
+                buckets[bucket] += (fingerprint,)
+                self._count += 1
+                return True
+        bucket = self._rng.choice((first, second))
+        for _ in range(CUCKOO_MAX_KICKS):
+            # Swap with a random resident of the full bucket and move that one to its other bucket
+            resident = buckets[bucket]
+            slot = self._rng.randrange(CUCKOO_BUCKET_SLOTS)
+            buckets[bucket] = resident[:slot] + (fingerprint,) + resident[slot + 1:]
+            fingerprint = resident[slot]
+            bucket = self._alternate(bucket, fingerprint)
+            if len(buckets[bucket]) < CUCKOO_BUCKET_SLOTS:
+                buckets[bucket] += (fingerprint,)
+                self._count += 1
+                return True
+        return False
+
+    def remove(self, key):
+        """Drop one copy of key's fingerprint; only call this for keys that were added."""
+        value = self.hash_function(key, self.seed)
+        fingerprint = value >> self._fingerprint_shift
+        first = value & self._mask
+        for bucket in (first, self._alternate(first, fingerprint)):
+            resident = self.buckets[bucket]
+            if fingerprint in resident:
+                slot = resident.index(fingerprint)
+                self.buckets[bucket] = resident[:slot] + resident[slot + 1:]
+                self._count -= 1
+                return True
+        return False
+
+
+class FilteredHashSet:
+    """Any hash set engine behind a CuckooFilter that answers most absent lookups.
+
+    The filter is updated only when the set really changes, so the two stay in sync.
+    It uses the set's own hash function and seed, so a lookup hashes the key once for
+    both. Other attributes (capacity, bucket_contents, ...) are those of the wrapped set.
+    """
+
+    def __init__(self, hash_set, false_positive_rate=0.01):
+        self.hash_set = hash_set
+        self.false_positive_rate = false_positive_rate
+        self.filtered = 0
+        self.passed = 0
+        self.false_positives = 0
+        self._hash = hash_set.hash_function
+        self._seed = hash_set.seed
+        self._contains_hashed = hash_set.contains_hashed
+        self._build(max(len(hash_set), 1024))
+
+    def _build(self, capacity):
+        if capacity > FILTER_MAX_GROWTH * max(len(self.hash_set), 1024):
+            # Keys with one hash value share a fingerprint and bucket pair, so no size can hold them
+            raise ValueError("Too many keys share a hash value for a cuckoo filter; use a stronger hash function.")
+        self.filter = CuckooFilter(capacity, self.false_positive_rate, self._hash, self._seed)
+        # Everything contains() needs, in one attribute: the absent-key path must cost less
+        # than the wrapped set's own lookup, and each attribute load is a noticeable share of it
+        self._probe = (self._hash, self._seed, self.filter.buckets, self.filter._mask,
+                       self.filter._fingerprint_shift)
+        for key in self.hash_set:
+            if not self.filter.add(key):
+                return self._build(capacity * 2)
+
+    def __getattr__(self, name):
+        return getattr(self.hash_set, name)
+
+    def __len__(self):
+        return len(self.hash_set)
+
+    def __iter__(self):
+        return iter(self.hash_set)
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    @property
+    def lookups(self):
+        return self.filtered + self.passed
+
+    def contains(self, key):
+        hash_function, seed, buckets, mask, shift = self._probe
+        value = hash_function(key, seed)
+        # CuckooFilter.might_contain_hash inlined: the method call alone costs as much as the probe
+        fingerprint = value >> shift
+        if (fingerprint not in buckets[value & mask]
+                and fingerprint not in buckets[(value ^ fingerprint * CUCKOO_ALT_MULTIPLIER) & mask]):
+            self.filtered += 1
+            return False
+        self.passed += 1
+        found = self._contains_hashed(key, value)
+        if not found:
+            self.false_positives += 1
+        return found
+
+    def add(self, key):
+        if not self.hash_set.add(key):
+            return False
+        if not self.filter.add(key):
+            self._build(2 * len(self.hash_set))
+        return True
+
+    def remove(self, key):
+        if not self.hash_set.remove(key):
+            return False
+        self.filter.remove(key)
+        return True
+
+    def add_many(self, keys):
+        keys = list(dict.fromkeys(keys))
+        new = [key for key, present in zip(keys, self.hash_set.contains_many(keys)) if not present]
+        self.hash_set.add_many(new)
+        if len(self.filter) + len(new) > CUCKOO_LOAD * self.filter.slot_count:
+            self._build(2 * len(self.hash_set))
+        elif not all([self.filter.add(key) for key in new]):
+            self._build(2 * len(self.hash_set))
+        return len(new)
+
+    def contains_many(self, keys):
+        keys = list(keys)
+        found = self.filter.might_contain_many(keys)
+        maybe = np.flatnonzero(found)
+        found[maybe] = self.hash_set.contains_many([keys[i] for i in maybe])
+        self.filtered += len(keys) - len(maybe)
+        self.passed += len(maybe)
+        self.false_positives += len(maybe) - int(found.sum())
+        return found
+
+    def remove_many(self, keys):
+        keys = list(dict.fromkeys(keys))
+        present = [key for key, found in zip(keys, self.hash_set.contains_many(keys)) if found]
+        self.hash_set.remove_many(present)
+        for key in present:
+            self.filter.remove(key)
+        return len(present)
+
+    def stats(self):
+        """Lookup counters, the false-positive rate seen on absent keys, and filter memory."""
+        absent = self.filtered + self.false_positives
+        return {
+            "lookups": self.lookups,
+            "filtered": self.filtered,
+            "false_positives": self.false_positives,
+            "observed_false_positive_rate": self.false_positives / absent if absent else 0.0,
+            "target_false_positive_rate": self.false_positive_rate,
+            "fingerprint_bits": self.filter.fingerprint_bits,
+            "filter_bytes": self.filter.memory_bytes,
+            "filter_bytes_per_key": self.filter.memory_bytes / len(self.hash_set) if len(self.hash_set) else 0.0,
+        }
+
+
+# Storage engines HashTableApp can run on
+ENGINES = {"chaining": HashSet, "robin_hood": RobinHoodHashSet, "striped": StripedHashSet}
+
 
 class HashTableApp:
-    def __init__(self, root, size):
+    def __init__(self, root, main_app, size=10, hash_function=DEFAULT_HASH, seed=None, engine="chaining",
+                 path=None, false_positive_rate=None):
         self.root = root
-        self.size = size
-        self.hash_set = [None] * size
+        self.main_app = main_app  # Reference to the main application
+        if path is not None:
+            # Keys outlive the window; the per-process builtin hash cannot be stored, so FNV-1a stands in
+            self.hash_set = PersistentHashSet(path, size, seed=seed,
+                                              hash_function="fnv1a" if hash_function == "builtin" else hash_function)
+        else:
+            # Grows and shrinks from `size` buckets as keys are added and removed
+            self.hash_set = ENGINES[engine](size, hash_function=hash_function, seed=seed)
+        if false_positive_rate is not None:
+            # Answer most contains() calls for absent keys from a cuckoo filter
+            self.hash_set = FilteredHashSet(self.hash_set, false_positive_rate)
         self.root.geometry("1200x700")
         self.root.configure(bg="#D3D3D3")
         root.title("Hash Set GUI")
@@ -16,10 +1231,8 @@ class HashTableApp:
 
         self.hash_set_frame = tk.Frame(root, bg="#D3D3D3")
         self.hash_set_frame.pack(pady=15)
-        self.hash_set_labels = [tk.Label(self.hash_set_frame, text=f"{i} :", font=("Arial", 20),
-                                          bg="#D3D3D3", fg="black") for i in range(self.size)]
-        for i, label in enumerate(self.hash_set_labels):
-            label.grid(row=i, column=0, sticky=tk.W, padx=40)
+        self.hash_set_labels = []
+        self.update_display()
 
         self.container = tk.Frame(root, bg="#A9A9A9")
         self.container.pack(pady=40)
@@ -53,14 +1266,13 @@ class HashTableApp:
                                      command=self.size_func)
         self.size_button.grid(row=0, column=3, padx=15)
 
-    def ascii_hash_function(self, key):
-        ascii_sum = sum(ord(char) for char in key)
-        return ascii_sum % self.size
+        self.load_button = tk.Button(self.button_frame, text="load file", **button_style,
+                                     command=self.load_file)
+        self.load_button.grid(row=0, column=4, padx=15)
 
     def contains(self):
         key = self.entry.get()
-        index = self.ascii_hash_function(key)
-        if self.hash_set[index] is not None and key in self.hash_set[index]:
+        if key in self.hash_set:
             messagebox.showinfo("Result", f"'{key}' is in the hash set.")
         else:
             messagebox.showinfo("Result", f"'{key}' is NOT in the hash set.")
@@ -70,11 +1282,7 @@ class HashTableApp:
         if not key:
             messagebox.showwarning("Warning", "Please enter a value to add.")
             return
-        index = self.ascii_hash_function(key)
-        if self.hash_set[index] is None:
-            self.hash_set[index] = []
-        if key not in self.hash_set[index]:
-            self.hash_set[index].append(key)
+        if self.hash_set.add(key):
             self.update_display()
         else:
             messagebox.showwarning("Warning", f"'{key}' already exists.")
@@ -84,25 +1292,51 @@ class HashTableApp:
         if not key:
             messagebox.showwarning("Warning", "Please enter a value to remove.")
             return
-        index = self.ascii_hash_function(key)
-        if self.hash_set[index] and key in self.hash_set[index]:
-            self.hash_set[index].remove(key)
-            if len(self.hash_set[index]) == 0:
-                self.hash_set[index] = None
+        if self.hash_set.remove(key):
             self.update_display()
         else:
             messagebox.showwarning("Warning", f"'{key}' is not in the hash set.")
 
+    def load_file(self):
+        """Add every line of a text file in one add_many batch."""
+        path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, encoding="utf-8", errors="replace") as stream:
+                keys = [line.strip() for line in stream if line.strip()]
+        except OSError as error:
+            messagebox.showerror("Error", f"Could not read the file:\n{error}")
+            return
+        added = self.hash_set.add_many(keys)
+        self.update_display()
+        messagebox.showinfo("Loaded", f"Added {added:,} of {len(keys):,} keys.")
+
     def size_func(self):
-        size = sum(len(bucket) for bucket in self.hash_set if bucket is not None)
-        messagebox.showinfo("Size", f"The size of the hash set is: {size}")
+        message = (f"The size of the hash set is: {len(self.hash_set)} "
+                   f"({self.hash_set.capacity} buckets, load {self.hash_set.load_factor:.2f})")
+        if isinstance(self.hash_set, FilteredHashSet):
+            stats = self.hash_set.stats()
+            message += (f"\nFilter: {stats['filtered']:,} of {stats['lookups']:,} lookups answered, "
+                        f"false-positive rate {stats['observed_false_positive_rate']:.2%}, "
+                        f"{stats['filter_bytes_per_key']:.1f} bytes/key")
+        messagebox.showinfo("Size", message)
 
     def update_display(self):
+        buckets = self.hash_set.bucket_contents(DISPLAY_BUCKET_LIMIT)
+        if len(self.hash_set_labels) != len(buckets):
+            # The set has been resized: lay the labels out again
+            for label in self.hash_set_labels:
+                label.destroy()
+            self.hash_set_labels = [tk.Label(self.hash_set_frame, text=f"{i} :", font=("Arial", 20),
+                                             bg="#D3D3D3", fg="black") for i in range(len(buckets))]
+            for i, label in enumerate(self.hash_set_labels):
+                label.grid(row=i % DISPLAY_ROWS, column=i // DISPLAY_ROWS, sticky=tk.W, padx=40)
         for i, label in enumerate(self.hash_set_labels):
-            values = ", ".join(self.hash_set[i]) if self.hash_set[i] else ""
+            values = ", ".join(buckets[i]) if buckets[i] else ""
             label.config(text=f"{i} : {values}")
 
 if __name__ == "__main__":
     root = tk.Tk()
-    app = HashTableApp(root, size=10)
+    app = HashTableApp(root, None, size=10)
     root.mainloop()
@@ -0,0 +1,254 @@
+"""Benchmark the hash_table_app hash functions on realistic string keys.
+
+Run with ``python hash_table_benchmark.py`` to hash 1M keys (lines of --keys-file, or
+generated URLs, e-mail addresses, identifiers and anagram-heavy words) with every
+function in HASH_FUNCTIONS. For each it prints the bucket-length distribution at load
+factor 1 against the Poisson ideal, the time per hash, and the mean and p99 latency of
+lookups in a chained table built with it.
+
+With ``--engines`` it instead fills each engine in ENGINES to load factors 0.5..0.9
+of the same power-of-two capacity and reports memory per key (tracemalloc, keys
+themselves excluded), mean and p99 lookup latency, and the absent-key latency again
+with the engine behind a FilteredHashSet.
+
+With ``--threads 1,2,4,...`` it runs a mixed contains/add/remove workload on a
+StripedHashSet and on a HashSet behind one global lock at each thread count, checks
+that every thread's keys ended up exactly as that thread left them, and reports
+throughput.
+"""
+import argparse
+import itertools
+import math
+import random
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from hash_table_app import ENGINES, HASH_FUNCTIONS, FilteredHashSet, HashSet, StripedHashSet
+
+# Lookups timed per function, half present and half absent
+LOOKUP_SAMPLE = 20000
+ENGINE_LOAD_FACTORS = (0.5, 0.6, 0.7, 0.8, 0.9)
+# Concurrency workload: operations split across the threads, and the share that write
+THREAD_OPERATIONS = 200_000
+WRITE_FRACTION = 0.2
+FIRST_NAMES = ["james", "mary", "rajnish", "li", "fatima", "olga", "carlos", "aiko", "noah", "emma"]
+DOMAINS = ["example.com", "mail.org", "corp.net", "uni.edu"]
+PATHS = ["user", "orders", "api/v2/items", "static/img", "search"]
+
+
+def generated_keys(count, seed):
+    """A mix of URL, e-mail, identifier and anagram keys, all distinct."""
+    rng = random.Random(seed)
+    letters = "etaoinshrdlu"
+    keys = set()
+    while len(keys) < count:
+        kind = rng.randrange(4)
+        if kind == 0:
+            keys.add(f"https://{rng.choice(DOMAINS)}/{rng.choice(PATHS)}/{rng.randrange(10 ** 6)}")
+        elif kind == 1:
+            keys.add(f"{rng.choice(FIRST_NAMES)}.{rng.choice(FIRST_NAMES)}{rng.randrange(1000)}@{rng.choice(DOMAINS)}")
+        elif kind == 2:
+            keys.add(f"ID-{rng.randrange(10 ** 9):09d}")
+        else:
+            keys.add("".join(rng.sample(letters, rng.randint(5, 9))))
+    return list(keys)
+
+
+def file_keys(path, count):
+    """Distinct lines of path, suffixed with a counter on further passes until count is reached."""
+    with open(path, encoding="utf-8", errors="replace") as stream:
+        words = list(dict.fromkeys(line.strip() for line in stream if line.strip()))
+    keys = []
+    for round_number in itertools.count():
+        suffix = "" if round_number == 0 else f"#{round_number}"
+        keys.extend(word + suffix for word in words[:count - len(keys)])
+        if len(keys) >= count or not words:
+            return keys
+
+
+def distribution(hashes, buckets):
+    lengths = np.bincount(hashes % buckets, minlength=buckets)
+    load = len(hashes) / buckets
+    # Under an ideal hash, bucket lengths are Poisson(load): variance == load
+    return {
+        "max": int(lengths.max()),
+        "empty": float((lengths == 0).mean()),
+        "ideal_empty": math.exp(-load),
+        "variance_ratio": float(lengths.var() / load),
+        "histogram": np.bincount(np.minimum(lengths, 10)).tolist(),
+    }
+
+
+def lookup_latencies(function, seed, keys, buckets, absent):
+    """Per-lookup nanoseconds of `key in bucket` on a chained table built with function."""
+    table = [[] for _ in range(buckets)]
+    for key in keys:
+        table[function(key, seed) % buckets].append(key)
+    probes = random.Random(seed).sample(keys, min(LOOKUP_SAMPLE // 2, len(keys))) + absent
+    clock = time.perf_counter_ns
+    latencies = []
+    for key in probes:
+        started = clock()
+        key in table[function(key, seed) % buckets]
+        latencies.append(clock() - started)
+    return np.array(latencies)
+
+
+def timed_lookups(contains, probes):
+    clock = time.perf_counter_ns
+    latencies = []
+    for key in probes:
+        started = clock()
+        contains(key)
+        latencies.append(clock() - started)
+    return np.array(latencies)
+
+
+def compare_engines(keys, absent, seed):
+    # Largest power of two that the keys can fill to the highest load factor
+    capacity = 1 << (int(len(keys) / max(ENGINE_LOAD_FACTORS)).bit_length() - 1)
+    print(f"{'engine':<11} {'load':>5} {'keys':>9} {'bytes/key':>10} {'hit mean':>9} {'hit p99':>8} "
+          f"{'miss mean':>10} {'miss p99':>9} {'filt mean':>10} {'filt p99':>9}")
+    for load in ENGINE_LOAD_FACTORS:
+        subset = keys[:int(load * capacity)]
+        hits = random.Random(seed).sample(subset, min(LOOKUP_SAMPLE // 2, len(subset)))
+        for name, engine in ENGINES.items():
+            tracemalloc.start()
+            # Never let the engine resize: the point is to measure it at this load
+            hash_set = engine(capacity, max_load_factor=0.95, min_load_factor=0.0, seed=seed)
+            for key in subset:
+                hash_set.add(key)
+            used = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            assert hash_set.capacity == capacity
+            hit = timed_lookups(hash_set.contains, hits)
+            miss = timed_lookups(hash_set.contains, absent)
+            # The same absent keys, with a cuckoo filter answering most of them first
+            filtered = timed_lookups(FilteredHashSet(hash_set).contains, absent)
+            print(f"{name:<11} {load:>5.1f} {len(subset):>9,} {used / len(subset):>10.1f} "
+                  f"{hit.mean():>9.0f} {np.percentile(hit, 99):>8.0f} "
+                  f"{miss.mean():>10.0f} {np.percentile(miss, 99):>9.0f} "
+                  f"{filtered.mean():>10.0f} {np.percentile(filtered, 99):>9.0f}")
+
+
+class GlobalLockHashSet:
+    """A HashSet behind a single lock: the baseline lock striping has to beat."""
+
+    def __init__(self, seed):
+        self._set = HashSet(64, seed=seed)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._set)
+
+    def contains(self, key):
+        with self._lock:
+            return self._set.contains(key)
+
+    def add(self, key):
+        with self._lock:
+            return self._set.add(key)
+
+    def remove(self, key):
+        with self._lock:
+            return self._set.remove(key)
+
+
+def _worker(hash_set, number, operations, shared, barrier, failures):
+    """Mixed workload: reads of shared keys, plus adds and removes of this thread's own keys."""
+    rng = random.Random(number)
+    own = set()
+    barrier.wait()
+    for _ in range(operations):
+        if rng.random() < WRITE_FRACTION:
+            key = f"t{number}-{rng.randrange(1000)}"
+            if key in own:
+                hash_set.remove(key)
+                own.discard(key)
+            else:
+                hash_set.add(key)
+                own.add(key)
+        elif not hash_set.contains(rng.choice(shared)):
+            failures.append(number)
+    # Stress check: no other thread's traffic or resize may have lost or invented a key
+    for key in (f"t{number}-{i}" for i in range(1000)):
+        if hash_set.contains(key) != (key in own):
+            failures.append(number)
+    return len(own)
+
+
+def concurrency(keys, thread_counts, seed):
+    shared = keys[:10000]
+    print(f"{'engine':<12} {'threads':>7} {'ops/s':>10} {'speedup':>8}")
+    for name, factory in (("global_lock", lambda: GlobalLockHashSet(seed)),
+                          ("striped", lambda: StripedHashSet(seed=seed))):
+        baseline = None
+        for threads in thread_counts:
+            hash_set = factory()
+            for key in shared:
+                hash_set.add(key)
+            barrier = threading.Barrier(threads + 1)
+            failures = []
+            owned = [0] * threads
+            operations = THREAD_OPERATIONS // threads
+
+            def run(number):
+                owned[number] = _worker(hash_set, number, operations, shared, barrier, failures)
+
+            workers = [threading.Thread(target=run, args=(number,)) for number in range(threads)]
+            for worker in workers:
+                worker.start()
+            barrier.wait()
+            started = time.perf_counter()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+            if failures or len(hash_set) != len(shared) + sum(owned):
+                raise AssertionError(f"{name} lost updates with {threads} threads")
+            throughput = operations * threads / elapsed
+            baseline = baseline or throughput
+            print(f"{name:<12} {threads:>7} {throughput:>10,.0f} {throughput / baseline:>7.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--keys-file", help="newline-separated keys, e.g. /usr/share/dict/words")
+    parser.add_argument("--functions", default=",".join(HASH_FUNCTIONS))
+    parser.add_argument("--load-factor", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engines", action="store_true", help="compare storage engines instead of hashes")
+    parser.add_argument("--threads", help="comma-separated thread counts for the concurrency benchmark, e.g. 1,2,4,8,16,32,64")
+    args = parser.parse_args()
+
+    keys = file_keys(args.keys_file, args.count) if args.keys_file else generated_keys(args.count, args.seed)
+    absent = [key + "~absent" for key in keys[:LOOKUP_SAMPLE // 2]]
+    buckets = max(1, int(len(keys) / args.load_factor))
+    seed = random.Random(args.seed).getrandbits(128)
+    if args.engines:
+        compare_engines(keys, absent, seed)
+        return
+    if args.threads:
+        concurrency(keys, [int(count) for count in args.threads.split(",")], seed)
+        return
+    print(f"{len(keys):,} keys in {buckets:,} buckets")
+
+    print(f"{'function':<9} {'ns/hash':>8} {'max':>5} {'empty':>7} {'ideal':>7} {'var/ideal':>9} "
+          f"{'mean ns':>8} {'p99 ns':>7}  bucket lengths 0..10+")
+    for name in args.functions.split(","):
+        function = HASH_FUNCTIONS[name]
+        started = time.perf_counter()
+        hashes = np.array([function(key, seed) for key in keys], dtype=np.uint64)
+        per_hash = (time.perf_counter() - started) / len(keys) * 1e9
+        stats = distribution(hashes, np.uint64(buckets))
+        latencies = lookup_latencies(function, seed, keys, buckets, absent)
+        print(f"{name:<9} {per_hash:>8.0f} {stats['max']:>5} {stats['empty']:>7.3f} {stats['ideal_empty']:>7.3f} "
+              f"{stats['variance_ratio']:>9.2f} {latencies.mean():>8.0f} {np.percentile(latencies, 99):>7.0f}  "
+              f"{stats['histogram']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,68 +1,752 @@
 import tkinter as tk
 from tkinter import messagebox, ttk, Menu
-import heapq
-from collections import defaultdict
+import os
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Bits looked up per step by the table-driven decoder
+DECODE_TABLE_BITS = 12
+# Longest code the builder will emit; package-merge limits lengths when Huffman would exceed it
+MAX_CODE_LENGTH = 15
+# Encoded bits shown in the GUI output before it is abbreviated
+DISPLAY_BITS_LIMIT = 512
+# Header flag bits: the payload is UTF-8 text; code lengths are packed two per byte
+HEADER_TEXT = 1
+HEADER_NIBBLES = 2
+# Streaming container: magic, then the code header, then framed blocks of CHUNK_SIZE input bytes.
+# Each block frame is (input bytes, payload bytes, padding bits); a zero-length frame ends the file.
+FILE_MAGIC = b"HUF1"
+CHUNK_SIZE = 1 << 20
+BLOCK_FRAME = struct.Struct(">IIB")
+# Seekable block archive: magic, independently coded blocks (each a full encode() record),
+# an index of (offset, record bytes, input bytes) per block, and a trailer locating the index
+ARCHIVE_MAGIC = b"HUFB"
+ARCHIVE_INDEX_ENTRY = struct.Struct(">QII")
+ARCHIVE_TRAILER = struct.Struct(">QI4s")
+ARCHIVE_TRAILER_MAGIC = b"HUFI"
+# Adaptive stream: magic, then one FGK bitstream. New symbols are sent as the NYT code plus a
+# 9-bit literal, and the literal ADAPTIVE_END closes the stream so trailing padding is ignored.
+ADAPTIVE_MAGIC = b"HUFA"
+ADAPTIVE_LITERAL_BITS = 9
+ADAPTIVE_END = 256
+
+class BitWriter:
+    """Packs variable-length codes most significant bit first into a bytearray."""
 
-class Node:
-    def __init__(self, char, freq):
-        self.char = char
-        self.freq = freq
-        self.left = None
-        self.right = None
+    def __init__(self):
+        self.data = bytearray()
+        self.bit_length = 0
+        self._buffer = 0
+        self._buffered = 0
+
+    def write(self, value, bits):
+        self._buffer = (self._buffer << bits) | value
+        self._buffered += bits
+        self.bit_length += bits
+        if self._buffered >= 64:
+            self._drain()
+
+    def write_symbols(self, symbols, code_table):
+        """Write the code of every symbol, where code_table maps symbol -> (value, bits)."""
+        buffer, buffered, data = self._buffer, self._buffered, self.data
+        written = 0
+        for symbol in symbols:
+            value, bits = code_table[symbol]
+            buffer = (buffer << bits) | value
+            buffered += bits
+            written += bits
+            if buffered >= 64:
+                spare = buffered & 7
+                data += (buffer >> spare).to_bytes(buffered >> 3, "big")
+                buffer &= (1 << spare) - 1
+                buffered = spare
+        self._buffer, self._buffered = buffer, buffered
+        self.bit_length += written
+
+    def _drain(self):
+        spare = self._buffered & 7
+        self.data += (self._buffer >> spare).to_bytes(self._buffered >> 3, "big")
+        self._buffer &= (1 << spare) - 1
+        self._buffered = spare
+
+    @property
+    def padding(self):
+        """Zero bits needed to fill out the last byte."""
+        return -self.bit_length % 8
+
+    def take(self):
+        """Remove and return the whole bytes written so far, for streaming output."""
+        self._drain()
+        data = bytes(self.data)
+        self.data.clear()
+        return data
+
+    def getvalue(self):
+        """Return the packed bytes, with the final partial byte zero-padded."""
+        self._drain()
+        if self._buffered:
+            return bytes(self.data) + bytes([self._buffer << (8 - self._buffered)])
+        return bytes(self.data)
+
+
+class BitReader:
+    """Reads bits most significant first from packed bytes holding bit_length valid bits."""
+
+    def __init__(self, data, bit_length=None):
+        self.data = memoryview(data).cast("B")
+        self.bit_length = len(self.data) * 8 if bit_length is None else bit_length
+        self.consumed = 0
+        self._position = 0
+        self._buffer = 0
+        self._buffered = 0
+
+    @property
+    def remaining(self):
+        return self.bit_length - self.consumed
+
+    def _refill(self, bits):
+        while self._buffered < bits and self._position < len(self.data):
+            chunk = self.data[self._position:self._position + 8]
+            self._position += len(chunk)
+            self._buffer = (self._buffer << (8 * len(chunk))) | int.from_bytes(chunk, "big")
+            self._buffered += 8 * len(chunk)
+
+    def peek(self, bits):
+        """Return the next bits without consuming them, zero-filled past the end."""
+        if self._buffered < bits:
+            self._refill(bits)
+            if self._buffered < bits:
+                return (self._buffer << (bits - self._buffered)) & ((1 << bits) - 1)
+        return (self._buffer >> (self._buffered - bits)) & ((1 << bits) - 1)
+
+    def skip(self, bits):
+        if bits > self.bit_length - self.consumed:
+            raise ValueError("Encoded data ends in the middle of a code.")
+        if self._buffered < bits:
+            self._refill(bits)
+        self._buffered -= bits
+        self.consumed += bits
+        self._buffer &= (1 << self._buffered) - 1
+
+    def read(self, bits):
+        value = self.peek(bits)
+        self.skip(bits)
+        return value
+
+    def read_table(self, table, table_bits, finish_code):
+        """Consume the rest of the stream through a HuffmanApp.build_decode_table table.
+
+        This is the decoder's hot loop, so the buffer lives in locals. Entries for codes
+        longer than the table are passed to finish_code(node, reader) after their first
+        table_bits bits have been skipped. Returns the list of decoded text pieces.
+        """
+        output = []
+        data = self.data
+        mask = (1 << table_bits) - 1
+        buffer, buffered, position = self._buffer, self._buffered, self._position
+        remaining = self.bit_length - self.consumed
+        while remaining > 0:
+            if buffered < table_bits and position < len(data):
+                chunk = data[position:position + 8]
+                position += len(chunk)
+                buffer = (buffer << (8 * len(chunk))) | int.from_bytes(chunk, "big")
+                buffered += 8 * len(chunk)
+            if buffered >= table_bits:
+                entry = table[(buffer >> (buffered - table_bits)) & mask]
+            else:
+                entry = table[(buffer << (table_bits - buffered)) & mask]
+            if entry[0] is None:
+                self._buffer, self._buffered, self._position = buffer, buffered, position
+                self.consumed = self.bit_length - remaining
+                self.skip(table_bits)
+                output.append(finish_code(entry[1], self))
+                buffer, buffered, position = self._buffer, self._buffered, self._position
+                remaining = self.bit_length - self.consumed
+                continue
+            if entry[1] <= remaining:
+                output.append(entry[0])
+                used = entry[1]
+            else:
+                output.append(entry[2])
+                used = entry[3]
+                if used > remaining:
+                    raise ValueError("Encoded data ends in the middle of a code.")
+            buffered -= used
+            remaining -= used
+            buffer &= (1 << buffered) - 1
+        self._buffer, self._buffered, self._position = buffer, buffered, position
+        self.consumed = self.bit_length - remaining
+        return output
+
+
+def _huffman_lengths(weights):
+    """Code lengths for ascending weights via the two-queue merge, in linear time.
+
+    Leaves are taken from the sorted weights and merged nodes from a second queue,
+    which fills in ascending order, so no heap is needed.
+    """
+    count = len(weights)
+    merged = []
+    parent = [0] * (2 * count - 1)
+    leaf = inner = 0
+    for node in range(count, 2 * count - 1):
+        weight = 0
+        for _ in range(2):
+            if leaf < count and (inner >= len(merged) or weights[leaf] <= merged[inner]):
+                parent[leaf] = node
+                weight += weights[leaf]
+                leaf += 1
+            else:
+                parent[count + inner] = node
+                weight += merged[inner]
+                inner += 1
+        merged.append(weight)
+    depth = [0] * (2 * count - 1)
+    for node in range(2 * count - 3, -1, -1):
+        depth[node] = depth[parent[node]] + 1
+    return depth[:count]
+
+
+def _package_merge(weights, limit):
+    """Optimal code lengths no longer than limit for ascending weights (package-merge)."""
+    leaves = [(weight, (index,)) for index, weight in enumerate(weights)]
+    items = leaves
+    for _ in range(limit - 1):
+        packages = [(items[i][0] + items[i + 1][0], items[i][1] + items[i + 1][1])
+                    for i in range(0, len(items) - 1, 2)]
+        items = sorted(leaves + packages, key=lambda item: item[0])
+    lengths = [0] * len(weights)
+    for _, symbols in items[:2 * len(weights) - 2]:
+        for index in symbols:
+            lengths[index] += 1
+    return lengths
 
-    def __lt__(self, other):
-        return self.freq < other.freq
 
 class HuffmanApp:
     def __init__(self):
-        self.huffman_tree = None
+        self.code_lengths = [0] * 256
         self.codes = {}
+        self.is_text = True
+        self._decode_table = None
+        self._canonical = None
+
+    @staticmethod
+    def to_bytes(data):
+        """Symbols are bytes; text is coded as its UTF-8 encoding."""
+        return data.encode("utf-8") if isinstance(data, str) else data
 
-    def calculate_frequencies(self, text):
-        frequency = defaultdict(int)
-        for char in text:
-            frequency[char] += 1
-        return frequency
+    def calculate_frequencies(self, data):
+        """Count all 256 byte values in one pass; returns an int64 array indexed by byte."""
+        return np.bincount(np.frombuffer(self.to_bytes(data), dtype=np.uint8), minlength=256)
 
     def build_huffman_tree(self, text):
-        frequency = self.calculate_frequencies(text)
-        heap = [Node(char, freq) for char, freq in frequency.items()]
-        heapq.heapify(heap)
-
-        while len(heap) > 1:
-            left = heapq.heappop(heap)
-            right = heapq.heappop(heap)
-            merged = Node(None, left.freq + right.freq)
-            merged.left = left
-            merged.right = right
-            heapq.heappush(heap, merged)
-
-        self.huffman_tree = heap[0]
-        self.build_codes(self.huffman_tree, "")
-
-    def build_codes(self, node, current_code):
-        if node:
-            if node.char is not None:
-                self.codes[node.char] = current_code
-            self.build_codes(node.left, current_code + "0")
-            self.build_codes(node.right, current_code + "1")
+        self.build_from_frequencies(self.calculate_frequencies(text))
+
+    def build_from_frequencies(self, frequency, max_length=MAX_CODE_LENGTH):
+        """Build canonical codes from 256 byte counts, no code longer than max_length bits."""
+        frequency = np.asarray(frequency, dtype=np.int64)
+        symbols = np.flatnonzero(frequency)
+        symbols = symbols[np.argsort(frequency[symbols], kind="stable")]
+        weights = frequency[symbols].tolist()
+        lengths = [0] * 256
+        if len(weights) == 1:
+            # A single distinct symbol still needs one bit per occurrence
+            lengths[symbols[0]] = 1
+        elif weights:
+            symbol_lengths = _huffman_lengths(weights)
+            if max(symbol_lengths) > max_length:
+                symbol_lengths = _package_merge(weights, max_length)
+            for symbol, length in zip(symbols.tolist(), symbol_lengths):
+                lengths[symbol] = length
+        self.assign_canonical_codes(lengths)
+
+    def assign_canonical_codes(self, lengths):
+        """Number codes in (length, symbol) order so the lengths alone define them."""
+        self.code_lengths = list(lengths)
+        self.codes = {}
+        code = 0
+        previous = 0
+        for length, symbol in sorted((length, symbol) for symbol, length in enumerate(lengths) if length):
+            code <<= length - previous
+            self.codes[symbol] = format(code, f"0{length}b")
+            code += 1
+            previous = length
+        self._decode_table = None
+        self._canonical = None
+
+    def serialize_header(self, padding):
+        """Header: flags, padding bits, last coded symbol, then one code length per symbol."""
+        lengths = self.code_lengths
+        count = max((symbol for symbol, length in enumerate(lengths) if length), default=0) + 1
+        nibbles = max(lengths) <= 15
+        flags = (HEADER_TEXT if self.is_text else 0) | (HEADER_NIBBLES if nibbles else 0)
+        header = bytearray([flags, padding, count - 1])
+        if nibbles:
+            padded = lengths[:count] + [0]
+            header.extend((padded[i] << 4) | padded[i + 1] for i in range(0, count, 2))
+        else:
+            header.extend(lengths[:count])
+        return bytes(header)
+
+    def code_table(self):
+        """Return a 256-entry list of (code value, code length), None for uncoded bytes."""
+        code_table = [None] * 256
+        for symbol, code in self.codes.items():
+            code_table[symbol] = (int(code, 2), len(code))
+        return code_table
+
+    def encode_block(self, data, code_table=None):
+        """Pack the codes for data; returns (payload bytes, padding bits) with no header."""
+        writer = BitWriter()
+        try:
+            writer.write_symbols(data, code_table or self.code_table())
+        except TypeError:
+            raise ValueError("Input contains a symbol that is not in the code table.") from None
+        return writer.getvalue(), writer.padding
 
     def encode(self, text):
-        return ''.join(self.codes[char] for char in text)
-
-    def decode(self, encoded_text):
-        current_node = self.huffman_tree
-        decoded_output = ""
-        for bit in encoded_text:
-            current_node = current_node.left if bit == '0' else current_node.right
-            if current_node.char:
-                decoded_output += current_node.char
-                current_node = self.huffman_tree
-        return decoded_output
+        """Encode text (str or bytes) as a code-length header followed by the packed bits."""
+        self.is_text = isinstance(text, str)
+        payload, padding = self.encode_block(self.to_bytes(text))
+        return self.serialize_header(padding) + payload
+
+    @staticmethod
+    def header_size(start):
+        """Total header length, given at least its first three bytes."""
+        count = start[2] + 1
+        return 3 + ((count + 1) // 2 if start[0] & HEADER_NIBBLES else count)
+
+    def unpack(self, encoded):
+        """Load the canonical code from an encoded header and return a BitReader over the payload."""
+        encoded = memoryview(encoded).cast("B")
+        if len(encoded) < 3:
+            raise ValueError("Encoded data is too short to hold a header.")
+        flags, padding, count = encoded[0], encoded[1], encoded[2] + 1
+        if flags & HEADER_NIBBLES:
+            size = (count + 1) // 2
+            lengths = []
+            for byte in encoded[3:3 + size]:
+                lengths += (byte >> 4, byte & 15)
+        else:
+            size = count
+            lengths = list(encoded[3:3 + size])
+        payload = encoded[3 + size:]
+        if len(encoded) < 3 + size or padding > len(payload) * 8:
+            raise ValueError("Encoded data ends inside its header.")
+        self.is_text = bool(flags & HEADER_TEXT)
+        self.assign_canonical_codes(lengths[:count] + [0] * (256 - count))
+        return BitReader(payload, len(payload) * 8 - padding)
+
+    def build_decode_table(self):
+        """Build the window lookup table straight from the canonical codes.
+
+        Each entry is (text, bits, first_char, first_bits): all complete codes in the
+        window and the bits they use, plus the first code alone for the end of the
+        stream. Windows that stop inside a longer code hold (None, window) instead.
+        """
+        ordered = sorted((len(code), symbol) for symbol, code in self.codes.items())
+        if not ordered:
+            raise ValueError("Encoded data has no codes.")
+        max_length = ordered[-1][0]
+        table_bits = min(max_length, DECODE_TABLE_BITS)
+        mask = (1 << table_bits) - 1
+        single = [None] * (1 << table_bits)
+        for length, symbol in ordered:
+            if length <= table_bits:
+                start = int(self.codes[symbol], 2) << (table_bits - length)
+                single[start:start + (1 << (table_bits - length))] = [(symbol, length)] * (1 << (table_bits - length))
+
+        table = []
+        for window, first in enumerate(single):
+            if first is None:
+                table.append((None, window))
+                continue
+            symbols = bytearray([first[0]])
+            used = first[1]
+            while True:
+                following = single[(window << used) & mask]
+                if following is None or following[1] > table_bits - used:
+                    break
+                symbols.append(following[0])
+                used += following[1]
+            table.append((bytes(symbols), used, bytes([first[0]]), first[1]))
+
+        # Per length: first canonical code, its index in ordered, and how many codes share it
+        first_code = [0] * (max_length + 2)
+        first_index = [0] * (max_length + 2)
+        count = [0] * (max_length + 2)
+        for index, (length, symbol) in enumerate(ordered):
+            if not count[length]:
+                first_code[length] = int(self.codes[symbol], 2)
+                first_index[length] = index
+            count[length] += 1
+        self._canonical = ([symbol for _, symbol in ordered], first_code, first_index, count, max_length)
+        self._decode_table = (table, table_bits)
+        return self._decode_table
+
+    def _finish_code(self, window, reader):
+        """Finish a code longer than the decode table one bit at a time, canonically."""
+        symbols, first_code, first_index, count, max_length = self._canonical
+        code = window
+        length = self._decode_table[1]
+        while length < max_length:
+            code = (code << 1) | reader.read(1)
+            length += 1
+            index = code - first_code[length]
+            if 0 <= index < count[length]:
+                return bytes([symbols[first_index[length] + index]])
+        raise ValueError("Encoded data contains an invalid code.")
+
+    def decode(self, encoded):
+        """Decode encode() output (or a BitReader over a payload for the current code)."""
+        reader = encoded if isinstance(encoded, BitReader) else self.unpack(encoded)
+        if reader.remaining == 0:
+            data = b""
+        else:
+            table, table_bits = self._decode_table or self.build_decode_table()
+            data = b"".join(reader.read_table(table, table_bits, self._finish_code))
+        return data.decode("utf-8") if self.is_text else data
+
+class AdaptiveHuffmanTree:
+    """FGK adaptive Huffman tree over bytes, kept in step by encoder and decoder.
+
+    Nodes are identified by their implicit number, so weights never decrease as the
+    number rises. Swapping two nodes swaps the contents of their slots.
+    """
+
+    def __init__(self):
+        size = 2 * 257 - 1
+        self.root = size - 1
+        self.nyt = self.root
+        self.weight = [0] * size
+        self.parent = [None] * size
+        self.left = [None] * size
+        self.right = [None] * size
+        self.symbol = [None] * size
+        self.leaf = {}
+
+    def code(self, node):
+        """Return (value, bits) of the path from the root to node."""
+        value = bits = 0
+        parent = self.parent
+        while node != self.root:
+            up = parent[node]
+            if self.right[up] == node:
+                value |= 1 << bits
+            bits += 1
+            node = up
+        return value, bits
+
+    def symbol_code(self, symbol):
+        """Return the (value, bits) to send for symbol, escaping through NYT if unseen."""
+        node = self.leaf.get(symbol)
+        if node is not None:
+            return self.code(node)
+        value, bits = self.code(self.nyt)
+        return (value << ADAPTIVE_LITERAL_BITS) | symbol, bits + ADAPTIVE_LITERAL_BITS
+
+    def _swap(self, a, b):
+        left, right, symbol = self.left, self.right, self.symbol
+        left[a], left[b] = left[b], left[a]
+        right[a], right[b] = right[b], right[a]
+        symbol[a], symbol[b] = symbol[b], symbol[a]
+        for node in (a, b):
+            if left[node] is not None:
+                self.parent[left[node]] = self.parent[right[node]] = node
+            elif symbol[node] is not None:
+                self.leaf[symbol[node]] = node
+
+    def update(self, symbol):
+        """Count one more occurrence of symbol, restoring the sibling property."""
+        node = self.leaf.get(symbol)
+        if node is None:
+            # NYT splits into a new NYT and a zero-weight leaf for symbol
+            old = self.nyt
+            self.nyt, node = old - 2, old - 1
+            self.left[old], self.right[old] = self.nyt, node
+            self.parent[self.nyt] = self.parent[node] = old
+            self.symbol[node] = symbol
+            self.leaf[symbol] = node
+        weight, parent = self.weight, self.parent
+        while node is not None:
+            # Highest-numbered node of equal weight leads the block
+            leader = node
+            while leader < self.root and weight[leader + 1] == weight[node]:
+                leader += 1
+            if leader != node and leader != parent[node]:
+                self._swap(node, leader)
+                node = leader
+            weight[node] += 1
+            node = parent[node]
+
+
+class AdaptiveHuffmanEncoder:
+    """One-pass encoder: call encode() per piece of input, then finish() once."""
+
+    def __init__(self):
+        self.tree = AdaptiveHuffmanTree()
+        self.writer = BitWriter()
+
+    def encode(self, data):
+        """Encode data and return the whole bytes ready so far."""
+        tree, writer = self.tree, self.writer
+        for symbol in HuffmanApp.to_bytes(data):
+            writer.write(*tree.symbol_code(symbol))
+            tree.update(symbol)
+        return writer.take()
+
+    def finish(self):
+        """Write the end marker and return the remaining bytes, zero-padded."""
+        self.writer.write(*self.tree.symbol_code(ADAPTIVE_END))
+        return self.writer.getvalue()
+
+
+class AdaptiveHuffmanDecoder:
+    """One-pass decoder fed arbitrary pieces of an AdaptiveHuffmanEncoder stream."""
+
+    def __init__(self):
+        self.tree = AdaptiveHuffmanTree()
+        self.finished = False
+        self._node = self.tree.root
+        self._literal = None
+
+    def decode(self, data):
+        """Decode as much of data as possible and return the bytes it completes.
+
+        A code cut off at the end of data is resumed by the next call.
+        """
+        tree = self.tree
+        reader = BitReader(data)
+        output = bytearray()
+        node, literal = self._node, self._literal
+        while not self.finished:
+            if literal is None and node == tree.nyt:
+                literal = (0, ADAPTIVE_LITERAL_BITS)
+            if literal is not None:
+                value, needed = literal
+                bits = min(needed, reader.remaining)
+                literal = (value << bits) | reader.read(bits), needed - bits
+                if literal[1]:
+                    break
+                symbol, literal = literal[0], None
+                if symbol == ADAPTIVE_END:
+                    self.finished = True
+                    break
+            elif tree.symbol[node] is not None:
+                symbol = tree.symbol[node]
+            else:
+                if not reader.remaining:
+                    break
+                node = tree.right[node] if reader.read(1) else tree.left[node]
+                continue
+            output.append(symbol)
+            tree.update(symbol)
+            node = tree.root
+        self._node, self._literal = node, literal
+        return bytes(output)
+
+
+def _read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Compressed file is truncated.")
+    return data
+
+
+def _chunks(stream, chunk_size):
+    """Yield successive chunks of a binary stream through one reused buffer."""
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        size = stream.readinto(buffer)
+        if not size:
+            return
+        yield view[:size]
+
+
+def compress_file(source, destination, chunk_size=CHUNK_SIZE):
+    """Huffman-compress a file in constant memory; returns (input bytes, output bytes).
+
+    The first pass counts byte frequencies chunk by chunk, the second encodes each
+    chunk as its own framed block under the shared code.
+    """
+    coder = HuffmanApp()
+    coder.is_text = False
+    frequency = np.zeros(256, dtype=np.int64)
+    with open(source, "rb") as stream:
+        for chunk in _chunks(stream, chunk_size):
+            frequency += coder.calculate_frequencies(chunk)
+    coder.build_from_frequencies(frequency)
+    code_table = coder.code_table()
+
+    read = 0
+    with open(source, "rb") as stream, open(destination, "wb") as output:
+        output.write(FILE_MAGIC + coder.serialize_header(0))
+        for chunk in _chunks(stream, chunk_size):
+            payload, padding = coder.encode_block(chunk, code_table)
+            output.write(BLOCK_FRAME.pack(len(chunk), len(payload), padding))
+            output.write(payload)
+            read += len(chunk)
+        output.write(BLOCK_FRAME.pack(0, 0, 0))
+        return read, output.tell()
+
+
+def decompress_file(source, destination):
+    """Restore a file written by compress_file, one block at a time; returns bytes written."""
+    coder = HuffmanApp()
+    written = 0
+    with open(source, "rb") as stream, open(destination, "wb") as output:
+        if stream.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError("Not a Huffman-compressed file.")
+        start = _read_exactly(stream, 3)
+        coder.unpack(start + _read_exactly(stream, coder.header_size(start) - 3))
+        while True:
+            size, payload_size, padding = BLOCK_FRAME.unpack(_read_exactly(stream, BLOCK_FRAME.size))
+            if not size:
+                return written
+            payload = _read_exactly(stream, payload_size)
+            block = coder.decode(BitReader(payload, payload_size * 8 - padding))
+            if len(block) != size:
+                raise ValueError("Compressed block does not decode to its recorded size.")
+            output.write(block)
+            written += size
+
+
+def compress_adaptive(source, destination, chunk_size=CHUNK_SIZE):
+    """Compress a file in one pass with adaptive Huffman codes; returns (input bytes, output bytes)."""
+    encoder = AdaptiveHuffmanEncoder()
+    read = 0
+    with open(source, "rb") as stream, open(destination, "wb") as output:
+        output.write(ADAPTIVE_MAGIC)
+        for chunk in _chunks(stream, chunk_size):
+            output.write(encoder.encode(chunk))
+            read += len(chunk)
+        output.write(encoder.finish())
+        return read, output.tell()
+
+
+def is_adaptive_stream(path):
+    with open(path, "rb") as stream:
+        return stream.read(len(ADAPTIVE_MAGIC)) == ADAPTIVE_MAGIC
+
+
+def decompress_adaptive(source, destination, chunk_size=CHUNK_SIZE):
+    """Restore a file written by compress_adaptive; returns bytes written."""
+    decoder = AdaptiveHuffmanDecoder()
+    written = 0
+    with open(source, "rb") as stream, open(destination, "wb") as output:
+        if stream.read(len(ADAPTIVE_MAGIC)) != ADAPTIVE_MAGIC:
+            raise ValueError("Not an adaptive Huffman stream.")
+        for chunk in _chunks(stream, chunk_size):
+            block = decoder.decode(chunk)
+            output.write(block)
+            written += len(block)
+            if decoder.finished:
+                break
+    if not decoder.finished:
+        raise ValueError("Compressed file is truncated.")
+    return written
+
+
+def _compress_range(source, offset, size):
+    """Worker: read one block of source and encode it under its own canonical code."""
+    with open(source, "rb") as stream:
+        stream.seek(offset)
+        data = stream.read(size)
+    coder = HuffmanApp()
+    coder.build_huffman_tree(data)
+    return coder.encode(data)
+
+
+def _decompress_range(source, offset, size):
+    """Worker: read one encoded block record and decode it."""
+    with open(source, "rb") as stream:
+        stream.seek(offset)
+        return HuffmanApp().decode(_read_exactly(stream, size))
+
+
+def _ordered_results(pool, function, tasks, window):
+    """Map function over tasks on pool, yielding results in order with at most window in flight."""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(function, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def compress_blocks(source, destination, block_size=CHUNK_SIZE, workers=None):
+    """Compress a file into a seekable archive of independently coded blocks on a process pool.
+
+    Workers read their block straight from source. Returns (input bytes, output bytes).
+    """
+    workers = workers or os.cpu_count() or 1
+    total = os.path.getsize(source)
+    tasks = [(source, offset, min(block_size, total - offset)) for offset in range(0, total, block_size)]
+    index = []
+    with open(destination, "wb") as output, ProcessPoolExecutor(max_workers=workers) as pool:
+        output.write(ARCHIVE_MAGIC)
+        for (_, _, size), record in zip(tasks, _ordered_results(pool, _compress_range, tasks, 2 * workers)):
+            index.append((output.tell(), len(record), size))
+            output.write(record)
+        index_offset = output.tell()
+        for entry in index:
+            output.write(ARCHIVE_INDEX_ENTRY.pack(*entry))
+        output.write(ARCHIVE_TRAILER.pack(index_offset, len(index), ARCHIVE_TRAILER_MAGIC))
+        return total, output.tell()
+
+
+def is_block_archive(path):
+    with open(path, "rb") as stream:
+        return stream.read(len(ARCHIVE_MAGIC)) == ARCHIVE_MAGIC
+
+
+def read_block_index(path):
+    """Return the archive's [(offset, record bytes, input bytes), ...] without reading any blocks."""
+    with open(path, "rb") as stream:
+        if stream.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+            raise ValueError("Not a Huffman block archive.")
+        stream.seek(-ARCHIVE_TRAILER.size, os.SEEK_END)
+        index_offset, count, magic = ARCHIVE_TRAILER.unpack(_read_exactly(stream, ARCHIVE_TRAILER.size))
+        if magic != ARCHIVE_TRAILER_MAGIC:
+            raise ValueError("Block archive trailer is missing or damaged.")
+        stream.seek(index_offset)
+        raw = _read_exactly(stream, count * ARCHIVE_INDEX_ENTRY.size)
+    return list(ARCHIVE_INDEX_ENTRY.iter_unpack(raw))
+
+
+def read_block(path, number, index=None):
+    """Decode block number of an archive without touching any other block."""
+    offset, size, expected = (index or read_block_index(path))[number]
+    block = _decompress_range(path, offset, size)
+    if len(block) != expected:
+        raise ValueError("Compressed block does not decode to its recorded size.")
+    return block
+
+
+def decompress_blocks(source, destination, workers=None):
+    """Restore a compress_blocks archive, decoding blocks concurrently; returns bytes written."""
+    workers = workers or os.cpu_count() or 1
+    index = read_block_index(source)
+    tasks = [(source, offset, size) for offset, size, _ in index]
+    written = 0
+    with open(destination, "wb") as output, ProcessPoolExecutor(max_workers=workers) as pool:
+        for (_, _, expected), block in zip(index, _ordered_results(pool, _decompress_range, tasks, 2 * workers)):
+            if len(block) != expected:
+                raise ValueError("Compressed block does not decode to its recorded size.")
+            output.write(block)
+            written += expected
+    return written
+
 
 class HuffmanCodingApp:
     def __init__(self, root):
-        self.huffman_coding = HuffmanCoding()
+        self.huffman_coding = HuffmanApp()
+        self.encoded_data = None
         self.root = root
         self.root.title("Huffman Coding Application")
         self.root.geometry("750x500")
@@ -162,16 +846,22 @@ class HuffmanCodingApp:
         text = self.input_text.get("1.0", tk.END).strip()
         if text:
             self.huffman_coding.build_huffman_tree(text)
-            encoded_text = self.huffman_coding.encode(text)
-            self.output_display.config(text=encoded_text)
-            self.set_status("Text encoded successfully.")
+            self.encoded_data = self.huffman_coding.encode(text)
+            reader = self.huffman_coding.unpack(self.encoded_data)
+            shown = min(reader.bit_length, DISPLAY_BITS_LIMIT)
+            bits = format(reader.peek(shown), f"0{shown}b") if shown else ""
+            if reader.bit_length > DISPLAY_BITS_LIMIT:
+                bits += "..."
+            self.output_display.config(text=bits)
+            self.set_status(f"Text encoded successfully: {len(text.encode())} bytes -> "
+                            f"{len(self.encoded_data)} bytes.")
         else:
             messagebox.showerror("Input Error", "Please enter text to encode.")
 
     def decode_text(self):
-        encoded_text = self.output_display.cget("text").strip()
-        if encoded_text:
-            decoded_text = self.huffman_coding.decode(encoded_text)
+        if self.encoded_data is not None:
+            decoded_text = self.huffman_coding.decode(self.encoded_data)
+            self.encoded_data = None
             self.output_display.config(text=decoded_text)
             self.set_status("Text decoded successfully.")
         else:
@@ -180,7 +870,8 @@ class HuffmanCodingApp:
     def reset_app(self):
         self.input_text.delete("1.0", tk.END)
         self.output_display.config(text="")
-        self.huffman_coding = HuffmanCoding()
+        self.huffman_coding = HuffmanApp()
+        self.encoded_data = None
         self.set_status("Application has been reset.")
 
     def show_about_info(self):
@@ -0,0 +1,215 @@
+"""Benchmark huffman_app against the zlib, bz2 and lzma codecs.
+
+Run with ``python huffman_benchmark.py`` to encode and decode generated text, binary,
+skewed and uniform corpora at each requested size (1K .. 1G). Throughput, compression
+ratio, tracemalloc peak and Huffman code/table build time are printed and written to
+JSON so that runs of different versions can be compared.
+"""
+import argparse
+import bz2
+import json
+import lzma
+import platform
+import time
+import tracemalloc
+import zlib
+
+import numpy as np
+
+from huffman_app import AdaptiveHuffmanDecoder, AdaptiveHuffmanEncoder, HuffmanApp
+
+SIZE_SUFFIXES = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+# Corpora are generated in pieces of this many bytes to bound temporary arrays
+GENERATE_PIECE = 1 << 20
+WORDS = ("the of and to in is was that for on with as by at from his her it an be this which "
+         "are or have had not but were all one their they there been has more when will would "
+         "who so no time about into than only other new some could these two may first then do "
+         "any like my now over such our man me even most made after also did many before must "
+         "through back years where much your way well down should because each just those people").split()
+
+
+def parse_size(text):
+    text = text.strip().upper().rstrip("B")
+    suffix = text[-1] if text and text[-1] in SIZE_SUFFIXES else ""
+    return int(float(text[:len(text) - len(suffix)]) * SIZE_SUFFIXES[suffix])
+
+
+def format_size(size):
+    for suffix in ("G", "M", "K"):
+        if size >= SIZE_SUFFIXES[suffix] and size % SIZE_SUFFIXES[suffix] == 0:
+            return f"{size // SIZE_SUFFIXES[suffix]}{suffix}"
+    return str(size)
+
+
+def _text_piece(rng, size):
+    """Space-separated words drawn with Zipf-like frequencies, with occasional line breaks."""
+    ranks = np.minimum(rng.zipf(1.3, size // 4 + 1), len(WORDS)) - 1
+    words = [WORDS[rank] for rank in ranks.tolist()]
+    for position in range(12, len(words), 13):
+        words[position] += ".\n"
+    return " ".join(words).encode()[:size]
+
+
+def _binary_piece(rng, size):
+    """Little-endian int32 samples of a slow random walk, like sensor or index data."""
+    samples = np.cumsum(rng.integers(-64, 65, size // 4 + 1), dtype=np.int64).astype("<i4")
+    return samples.tobytes()[:size]
+
+
+def _skewed_piece(rng, size):
+    """Bytes from a geometric distribution: a few symbols dominate."""
+    return np.minimum(rng.geometric(0.2, size) - 1, 255).astype(np.uint8).tobytes()
+
+
+def _uniform_piece(rng, size):
+    return rng.integers(0, 256, size, dtype=np.uint8).tobytes()
+
+
+CORPORA = {"text": _text_piece, "binary": _binary_piece, "skewed": _skewed_piece, "uniform": _uniform_piece}
+
+
+def generate(corpus, size, seed):
+    rng = np.random.default_rng(seed)
+    pieces = []
+    for start in range(0, size, GENERATE_PIECE):
+        pieces.append(CORPORA[corpus](rng, min(GENERATE_PIECE, size - start)))
+    return b"".join(pieces)
+
+
+def huffman_encode(data, timings):
+    coder = HuffmanApp()
+    started = time.perf_counter()
+    coder.build_huffman_tree(data)
+    timings["build"] = time.perf_counter() - started
+    return coder.encode(data)
+
+
+def huffman_decode(encoded, timings):
+    coder = HuffmanApp()
+    reader = coder.unpack(encoded)
+    started = time.perf_counter()
+    if reader.remaining:
+        coder.build_decode_table()
+    timings["table"] = time.perf_counter() - started
+    return coder.decode(reader)
+
+
+def adaptive_encode(data, timings):
+    encoder = AdaptiveHuffmanEncoder()
+    return encoder.encode(data) + encoder.finish()
+
+
+def adaptive_decode(encoded, timings):
+    return AdaptiveHuffmanDecoder().decode(encoded)
+
+
+CODECS = {
+    "huffman": (huffman_encode, huffman_decode),
+    "adaptive": (adaptive_encode, adaptive_decode),
+    "zlib": (lambda data, timings: zlib.compress(data), lambda encoded, timings: zlib.decompress(encoded)),
+    "bz2": (lambda data, timings: bz2.compress(data), lambda encoded, timings: bz2.decompress(encoded)),
+    "lzma": (lambda data, timings: lzma.compress(data), lambda encoded, timings: lzma.decompress(encoded)),
+}
+
+
+def best_of(function, argument, repeat):
+    """Run function(argument, timings) repeat times; return (result, best seconds, timings of that run)."""
+    best = None
+    for _ in range(repeat):
+        timings = {}
+        started = time.perf_counter()
+        result = function(argument, timings)
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best[1]:
+            best = (result, elapsed, timings)
+    return best
+
+
+def traced_peak(function, argument):
+    """Peak bytes traced by tracemalloc during one extra, untimed run."""
+    tracemalloc.start()
+    try:
+        function(argument, {})
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(codec, data, repeat, trace_memory):
+    encode, decode = CODECS[codec]
+    encoded, encode_seconds, encode_timings = best_of(encode, data, repeat)
+    decoded, decode_seconds, decode_timings = best_of(decode, encoded, repeat)
+    if decoded != data:
+        raise AssertionError(f"{codec} did not round-trip")
+    megabytes = len(data) / 1e6
+    return {
+        "codec": codec,
+        "input_bytes": len(data),
+        "output_bytes": len(encoded),
+        "ratio": len(encoded) / len(data) if data else 0.0,
+        "encode_seconds": encode_seconds,
+        "decode_seconds": decode_seconds,
+        "encode_mb_s": megabytes / encode_seconds if encode_seconds else None,
+        "decode_mb_s": megabytes / decode_seconds if decode_seconds else None,
+        "code_build_seconds": encode_timings.get("build"),
+        "decode_table_seconds": decode_timings.get("table"),
+        "encode_peak_bytes": traced_peak(encode, data) if trace_memory else None,
+        "decode_peak_bytes": traced_peak(decode, encoded) if trace_memory else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1K,64K,1M,16M",
+                        help="comma-separated corpus sizes with K/M/G suffixes, up to 1G")
+    parser.add_argument("--corpora", default=",".join(CORPORA))
+    parser.add_argument("--codecs", default="huffman,zlib,bz2,lzma", help=f"any of {','.join(CODECS)}")
+    parser.add_argument("--adaptive-limit", default="1M",
+                        help="largest corpus run through the pure-Python adaptive coder")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the best is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="huffman_benchmark.json")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    corpora = args.corpora.split(",")
+    codecs = args.codecs.split(",")
+    adaptive_limit = parse_size(args.adaptive_limit)
+    results = []
+
+    print(f"{'corpus':<8} {'size':>5} {'codec':<9} {'ratio':>7} {'enc MB/s':>9} {'dec MB/s':>9} "
+          f"{'build ms':>9} {'enc peak':>10} {'dec peak':>10}")
+    for corpus in corpora:
+        for size in sizes:
+            data = generate(corpus, size, args.seed)
+            for codec in codecs:
+                if codec == "adaptive" and size > adaptive_limit:
+                    continue
+                result = run_case(codec, data, args.repeat, not args.no_memory)
+                result.update(corpus=corpus, size=format_size(size))
+                results.append(result)
+                build = result["code_build_seconds"]
+                build = f"{build * 1000:.2f}" if build is not None else "-"
+                peaks = [f"{peak / 1e6:.1f}MB" if peak is not None else "-"
+                         for peak in (result["encode_peak_bytes"], result["decode_peak_bytes"])]
+                print(f"{corpus:<8} {result['size']:>5} {codec:<9} {result['ratio']:>7.3f} "
+                      f"{result['encode_mb_s'] or 0:>9.1f} {result['decode_mb_s'] or 0:>9.1f} "
+                      f"{build:>9} {peaks[0]:>10} {peaks[1]:>10}")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
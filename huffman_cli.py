@@ -0,0 +1,58 @@
+import argparse
+import sys
+import time
+
+from huffman_app import (CHUNK_SIZE, compress_adaptive, compress_blocks, compress_file, decompress_adaptive,
+                         decompress_blocks, decompress_file, is_adaptive_stream, is_block_archive)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compress or decompress files with streaming Huffman coding.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compress = commands.add_parser("compress", help="compress SOURCE into DESTINATION")
+    compress.add_argument("source")
+    compress.add_argument("destination")
+    compress.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="input bytes per block")
+    compress.add_argument("--workers", type=int, default=None,
+                          help="write a seekable archive of independently coded blocks using this many processes")
+    compress.add_argument("--adaptive", action="store_true",
+                          help="code in a single pass with adaptive Huffman codes, without a frequency pre-scan")
+
+    decompress = commands.add_parser("decompress", help="restore SOURCE into DESTINATION")
+    decompress.add_argument("source")
+    decompress.add_argument("destination")
+    decompress.add_argument("--workers", type=int, default=None, help="processes for block archives")
+
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    try:
+        if args.command == "compress" and args.adaptive:
+            read, written = compress_adaptive(args.source, args.destination, args.chunk_size)
+        elif args.command == "compress" and args.workers:
+            read, written = compress_blocks(args.source, args.destination, args.chunk_size, args.workers)
+        elif args.command == "compress":
+            read, written = compress_file(args.source, args.destination, args.chunk_size)
+        elif is_adaptive_stream(args.source):
+            written = decompress_adaptive(args.source, args.destination)
+            read = None
+        elif is_block_archive(args.source):
+            written = decompress_blocks(args.source, args.destination, args.workers)
+            read = None
+        else:
+            written = decompress_file(args.source, args.destination)
+            read = None
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    if read is None:
+        print(f"Restored {written:,} bytes in {elapsed:.2f}s")
+    else:
+        ratio = written / read if read else 0.0
+        print(f"Compressed {read:,} -> {written:,} bytes ({ratio:.1%}) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from binary_tree_app import BinaryTree
+
+
+def check_avl(node):
+    """Return the height of node's subtree, asserting heights and balance on the way."""
+    if node is None:
+        return 0
+    left, right = check_avl(node.left), check_avl(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+@pytest.mark.parametrize("keys", [list(range(2000)), list(range(2000, 0, -1)),
+                                  random.Random(0).sample(range(10000), 2000)])
+def test_avl_stays_balanced_under_inserts_and_deletes(keys):
+    tree = BinaryTree(balance="avl")
+    model = []
+    for key in keys:
+        tree.insert(key)
+        model.append(key)
+    check_avl(tree.root)
+    assert tree.height() <= 1.45 * (len(model) + 2).bit_length()
+    rng = random.Random(1)
+    for key in rng.sample(keys, len(keys) // 2):
+        tree.delete(key)
+        model.remove(key)
+    check_avl(tree.root)
+    assert tree.inorder_traversal() == sorted(model)
+    assert all(tree.contains(key) for key in model)
+
+
+def test_avl_matches_unbalanced_tree_contents():
+    rng = random.Random(2)
+    balanced, unbalanced = BinaryTree(balance="avl"), BinaryTree()
+    for _ in range(3000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            balanced.insert(key)
+            unbalanced.insert(key)
+        else:
+            balanced.delete(key)
+            unbalanced.delete(key)
+        assert balanced.inorder_traversal() == unbalanced.inorder_traversal()
+    check_avl(balanced.root)
+
+
+def test_unbalanced_tree_traverses_a_degenerate_chain():
+    tree = BinaryTree()
+    for key in range(900):
+        tree.insert(key)
+    assert tree.height() == 900
+    assert tree.inorder_traversal() == list(range(900))
+    assert tree.postorder_traversal()[-1] == 0
+
+
+def test_unknown_balance_mode():
+    with pytest.raises(ValueError):
+        BinaryTree(balance="red-black-ish")
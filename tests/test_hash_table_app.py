@@ -0,0 +1,173 @@
+import itertools
+import random
+import threading
+
+import pytest
+
+from hash_table_app import (HASH_FUNCTIONS, CuckooFilter, FilteredHashSet, HashSet, PersistentHashSet,
+                            RobinHoodHashSet, StripedHashSet)
+
+ENGINES = [HashSet, RobinHoodHashSet, StripedHashSet]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("hash_function", ["builtin", "fnv1a", "ascii"])
+def test_engine_matches_builtin_set(engine, hash_function):
+    rng = random.Random(7)
+    hash_set = engine(hash_function=hash_function, seed=42)
+    model = set()
+    for _ in range(6000):
+        key = str(rng.randrange(800))
+        operation = rng.random()
+        if operation < 0.5:
+            assert hash_set.add(key) == (key not in model)
+            model.add(key)
+        elif operation < 0.8:
+            assert hash_set.remove(key) == (key in model)
+            model.discard(key)
+        else:
+            assert hash_set.contains(key) == (key in model)
+        assert len(hash_set) == len(model)
+    assert sorted(hash_set) == sorted(model)
+    assert sorted(key for bucket in hash_set.bucket_contents() for key in bucket) == sorted(model)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_batch_operations_match_builtin_set(engine):
+    hash_set = engine(seed=3)
+    keys = [f"key{i}" for i in range(5000)]
+    assert hash_set.add_many(keys + keys[:100]) == 5000
+    assert hash_set.contains_many(["key1", "missing", "key4999"]).tolist() == [True, False, True]
+    assert hash_set.remove_many(keys[:4900] + ["missing"]) == 4900
+    assert sorted(hash_set) == sorted(keys[4900:])
+
+
+def test_incremental_rehash_never_forces_a_full_migration(monkeypatch):
+    hash_set = HashSet(seed=1)
+    forced = []
+    rehash_now = HashSet.rehash_now
+
+    def counting_rehash_now(self):
+        if self.rehashing:
+            forced.append(len(self._old) - self._next)
+        rehash_now(self)
+
+    for i in range(20000):
+        hash_set.add(str(i))
+    monkeypatch.setattr(HashSet, "rehash_now", counting_rehash_now)
+    for i in range(20000):
+        hash_set.remove(str(i))
+    for round_number in range(200):
+        batch = [f"{round_number}-{i}" for i in range(20)]
+        for key in batch:
+            hash_set.add(key)
+        for key in batch:
+            hash_set.remove(key)
+    assert forced == []
+
+
+def test_hash_functions_are_seeded():
+    for name, function in HASH_FUNCTIONS.items():
+        if name != "ascii":
+            assert function("key", 1) != function("key", 2), name
+
+
+def test_striped_set_concurrent_adds(monkeypatch):
+    hash_set = StripedHashSet(seed=5)
+    rebuilds = []
+    rebuild = StripedHashSet._rebuild
+
+    def counting_rebuild(self, grow):
+        capacity = self.capacity
+        rebuild(self, grow)
+        rebuilds.append(self.capacity != capacity)
+
+    monkeypatch.setattr(StripedHashSet, "_rebuild", counting_rebuild)
+
+    def insert(thread):
+        for i in range(5000):
+            hash_set.add(f"{thread}-{i}")
+
+    threads = [threading.Thread(target=insert, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(hash_set) == len(set(hash_set)) == 20000
+    # All the locks are taken for a real resize, plus at most once by each thread that queued behind it
+    assert rebuilds.count(False) <= (len(threads) - 1) * rebuilds.count(True)
+
+
+def test_persistent_set_survives_reopening(tmp_path):
+    path = str(tmp_path / "keys.hset")
+    with PersistentHashSet(path, capacity=8) as hash_set:
+        for i in range(500):
+            hash_set.add(f"key{i}")
+        for i in range(0, 500, 2):
+            hash_set.remove(f"key{i}")
+    with PersistentHashSet(path) as hash_set:
+        assert len(hash_set) == 250
+        assert sorted(hash_set) == sorted(f"key{i}" for i in range(1, 500, 2))
+        assert "key1" in hash_set and "key2" not in hash_set
+
+
+@pytest.mark.parametrize("content", [b"", b"HSET", b"x" * 100])
+def test_persistent_set_rejects_other_files(tmp_path, content):
+    path = tmp_path / "other"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        PersistentHashSet(str(path))
+
+
+def test_persistent_set_refuses_builtin_hash(tmp_path):
+    with pytest.raises(ValueError):
+        PersistentHashSet(str(tmp_path / "keys.hset"), hash_function="builtin")
+
+
+def test_cuckoo_filter_has_no_false_negatives():
+    cuckoo = CuckooFilter(2000, seed=9)
+    keys = [f"key{i}" for i in range(2000)]
+    assert all(cuckoo.add(key) for key in keys)
+    assert all(cuckoo.might_contain(key) for key in keys)
+    assert cuckoo.might_contain_many(keys).all()
+
+
+def test_filtered_set_matches_wrapped_set():
+    hash_set = FilteredHashSet(HashSet(seed=2))
+    keys = [f"key{i}" for i in range(3000)]
+    assert hash_set.add_many(keys) == 3000
+    assert hash_set.remove_many(keys[:1000]) == 1000
+    assert hash_set.contains_many(keys).tolist() == [False] * 1000 + [True] * 2000
+    assert not hash_set.contains("absent") and hash_set.contains("key2999")
+
+
+def test_filtered_set_answers_absent_keys_from_the_filter():
+    hash_set = FilteredHashSet(RobinHoodHashSet(seed=5), false_positive_rate=0.01)
+    hash_set.add_many(f"key{i}" for i in range(5000))
+    assert not any(hash_set.contains(f"absent{i}") for i in range(5000))
+    assert all(hash_set.contains(f"key{i}") for i in range(5000))
+    stats = hash_set.stats()
+    assert stats["lookups"] == 10000
+    assert stats["observed_false_positive_rate"] < 0.03
+    assert stats["filtered"] + stats["false_positives"] == 5000
+
+
+def test_filtered_set_rejects_a_hash_that_cannot_separate_keys():
+    hash_set = HashSet(hash_function="ascii", seed=0)
+    for key in ("".join(letters) for letters in itertools.permutations("abcdef")):
+        hash_set.add(key)
+    with pytest.raises(ValueError):
+        FilteredHashSet(hash_set)
+
+
+def test_bucket_contents_does_not_finish_a_migration():
+    hash_set = HashSet(capacity=64, seed=4)
+    for i in range(49):
+        hash_set.add(str(i))
+    assert hash_set.rehashing
+    contents = hash_set.bucket_contents()
+    assert hash_set.rehashing
+    assert len(contents) == hash_set.capacity
+    assert sorted(key for bucket in contents for key in bucket) == sorted(map(str, range(49)))
+    hash_set.rehash_now()
+    assert [sorted(bucket) for bucket in hash_set.bucket_contents()] == [sorted(bucket) for bucket in contents]
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from huffman_app import (HuffmanApp, compress_adaptive, compress_blocks, compress_file, decompress_adaptive,
+                         decompress_blocks, decompress_file, read_block, read_block_index)
+
+SAMPLES = [
+    "",
+    "a",
+    "aaaaaaaa",
+    "hello world",
+    "Ünïcödé text → with multi-byte characters",
+    bytes(range(256)) * 3,
+    bytes(random.Random(0).getrandbits(8) for _ in range(5000)),
+]
+
+
+@pytest.fixture
+def source(tmp_path):
+    rng = random.Random(1)
+    data = bytes(rng.getrandbits(8) for _ in range(3000)) + b"the quick brown fox " * 2000
+    path = tmp_path / "source.bin"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.mark.parametrize("data", SAMPLES)
+def test_encode_decode_round_trip(data):
+    coder = HuffmanApp()
+    coder.build_huffman_tree(data)
+    encoded = coder.encode(data)
+    assert HuffmanApp().decode(encoded) == data
+
+
+def test_skewed_frequencies_are_length_limited():
+    # Fibonacci counts force a Huffman code deeper than the length limit
+    frequency = [0] * 256
+    a, b = 1, 1
+    for symbol in range(40):
+        frequency[symbol] = a
+        a, b = b, a + b
+    coder = HuffmanApp()
+    coder.build_from_frequencies(frequency)
+    assert max(coder.code_lengths) <= 15
+    data = bytes(symbol for symbol in range(40) for _ in range(3))
+    assert HuffmanApp().decode(coder.encode(data)) == data
+
+
+@pytest.mark.parametrize("encoded", [b"", b"\x01", b"\x01\x00", b"\x01\x00\x05\x11"])
+def test_truncated_header_raises_value_error(encoded):
+    with pytest.raises(ValueError):
+        HuffmanApp().decode(encoded)
+
+
+def test_header_without_codes_raises_value_error():
+    with pytest.raises(ValueError, match="no codes"):
+        HuffmanApp().decode(b"\x01\x00\x00\x00\xff")
+
+
+def test_padding_longer_than_payload_raises_value_error():
+    coder = HuffmanApp()
+    coder.build_huffman_tree("abc")
+    encoded = bytearray(coder.encode("abc"))
+    encoded[1] = 200
+    with pytest.raises(ValueError):
+        HuffmanApp().decode(bytes(encoded))
+
+
+@pytest.mark.parametrize("compress, decompress", [
+    (compress_file, decompress_file),
+    (compress_adaptive, decompress_adaptive),
+    (lambda source, destination: compress_blocks(source, destination, 4096, workers=2),
+     lambda source, destination: decompress_blocks(source, destination, workers=2)),
+])
+def test_file_formats_round_trip_and_reject_damage(tmp_path, source, compress, decompress):
+    path, data = source
+    compressed = tmp_path / "compressed"
+    restored = tmp_path / "restored"
+    compress(str(path), str(compressed))
+    assert decompress(str(compressed), str(restored)) == len(data)
+    assert restored.read_bytes() == data
+
+    encoded = compressed.read_bytes()
+    damaged = tmp_path / "damaged"
+    damaged.write_bytes(encoded[:-7])
+    with pytest.raises(ValueError):
+        decompress(str(damaged), str(restored))
+    damaged.write_bytes(b"XXXX" + encoded[4:])
+    with pytest.raises(ValueError):
+        decompress(str(damaged), str(restored))
+
+
+def test_block_archive_reads_single_blocks(tmp_path, source):
+    path, data = source
+    archive = tmp_path / "archive"
+    compress_blocks(str(path), str(archive), 4096, workers=2)
+    index = read_block_index(str(archive))
+    assert len(index) == -(-len(data) // 4096)
+    assert read_block(str(archive), 2, index) == data[2 * 4096:3 * 4096]
@@ -0,0 +1,149 @@
+import queue
+import time
+
+import numpy as np
+import pytest
+
+from tsp_app import TSP, TSPApp, distances_from_coordinates, load_distance_matrix, load_tsplib
+
+EXACT_METHODS = ["held_karp", "enumeration", "branch_and_bound"]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    TSP.cache.clear()
+    yield
+    TSP.cache.clear()
+
+
+def random_matrix(num_cities, seed, symmetric=True):
+    rng = np.random.default_rng(seed)
+    matrix = rng.integers(1, 100, size=(num_cities, num_cities))
+    if symmetric:
+        matrix = matrix + matrix.T
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+
+def assert_valid_tour(tsp, route, distance):
+    assert sorted(route) == list(range(tsp.num_cities))
+    assert tsp.calculate_total_distance(route) == distance
+
+
+@pytest.mark.parametrize("method", EXACT_METHODS)
+@pytest.mark.parametrize("symmetric", [True, False])
+@pytest.mark.parametrize("num_cities", [2, 3, 4, 6, 8])
+def test_exact_solvers_match_brute_force(method, symmetric, num_cities):
+    for seed in range(3):
+        matrix = random_matrix(num_cities, seed, symmetric)
+        expected = TSP(matrix).solve("brute_force", use_cache=False)[1]
+        tsp = TSP(matrix)
+        route, distance = tsp.solve(method, use_cache=False)
+        assert distance == expected
+        assert_valid_tour(tsp, route, distance)
+        assert tsp.gap() == 0
+
+
+def test_parallel_exact_matches_held_karp():
+    matrix = random_matrix(9, 4)
+    tsp = TSP(matrix)
+    route, distance = tsp.solve("parallel", use_cache=False, workers=2)
+    assert distance == TSP(matrix).solve("held_karp", use_cache=False)[1]
+    assert_valid_tour(tsp, route, distance)
+
+
+def test_budgeted_branch_and_bound_keeps_a_valid_bound():
+    matrix = random_matrix(14, 5)
+    optimum = TSP(matrix).solve("held_karp", use_cache=False)[1]
+    tsp = TSP(matrix)
+    route, distance = tsp.solve("branch_and_bound", use_cache=False, node_limit=5)
+    assert_valid_tour(tsp, route, distance)
+    assert tsp.lower_bound <= optimum <= distance
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.int32, np.float32, np.float64])
+def test_heuristic_tours_on_narrow_dtypes(dtype):
+    coordinates = np.random.default_rng(6).uniform(0, 9000, (200, 2))
+    tsp = TSP(distances_from_coordinates(coordinates, dtype))
+    route, distance = tsp.solve("heuristic", use_cache=False)
+    assert sorted(route) == list(range(200))
+    assert distance == pytest.approx(tsp.calculate_total_distance(route))
+
+
+def test_cached_tour_from_another_method_does_not_skip_brute_force():
+    matrix = random_matrix(7, 8)
+    TSP(matrix).solve("held_karp")
+    tsp = TSP(matrix)
+    tsp.solve("brute_force")
+    assert tsp.nodes_explored == 5040
+
+
+def test_repeat_solve_hits_the_cache():
+    matrix = random_matrix(8, 9)
+    first = TSP(matrix).solve("held_karp")
+    assert TSP(matrix).solve("held_karp") == first
+    assert TSP.cache.stats()["hits"] == 1
+
+
+def test_loaders_agree(tmp_path):
+    coordinates = np.array([[0, 0], [3, 0], [3, 4], [0, 4]])
+    expected = distances_from_coordinates(coordinates, np.int32)
+    csv = tmp_path / "matrix.csv"
+    np.savetxt(csv, expected, delimiter=",", fmt="%d")
+    npy = tmp_path / "matrix.npy"
+    np.save(npy, expected)
+    tsplib = tmp_path / "square.tsp"
+    tsplib.write_text("NAME: square\nDIMENSION: 4\nEDGE_WEIGHT_TYPE: EUC_2D\nNODE_COORD_SECTION\n"
+                      + "".join(f"{i + 1} {x} {y}\n" for i, (x, y) in enumerate(coordinates)) + "EOF\n")
+    for path in (csv, npy):
+        assert np.array_equal(load_distance_matrix(str(path)), expected)
+    assert np.array_equal(load_tsplib(str(tsplib)), expected)
+
+
+def test_non_square_matrix_is_rejected(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("1,2,3\n4,5,6\n")
+    with pytest.raises(ValueError):
+        load_distance_matrix(str(path))
+
+
+def test_heuristic_on_asymmetric_matrix_only_shortens_the_tour():
+    tsp = TSP(random_matrix(60, 10, symmetric=False))
+    route, distance = tsp.solve("heuristic", use_cache=False)
+    assert_valid_tour(tsp, route, distance)
+    assert tsp.improvement_timeline[-1][1] == distance <= tsp.improvement_timeline[0][1]
+
+
+def test_branch_and_bound_heuristic_phase_respects_the_time_limit():
+    coordinates = np.random.default_rng(11).uniform(0, 1e5, (2000, 2))
+    tsp = TSP(distances_from_coordinates(coordinates, np.int32))
+    started = time.monotonic()
+    route, distance = tsp.solve("branch_and_bound", use_cache=False, time_limit=0.2)
+    assert time.monotonic() - started < 3
+    assert_valid_tour(tsp, route, distance)
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_parallel_result_does_not_depend_on_worker_count(symmetric):
+    # Distances 1-5 give many tours of equal length
+    matrix = np.random.default_rng(2).integers(1, 6, size=(10, 10))
+    if symmetric:
+        matrix = matrix + matrix.T
+    np.fill_diagonal(matrix, 0)
+    serial = TSP(matrix).solve("branch_and_bound", use_cache=False)
+    for workers in (1, 3):
+        assert TSP(matrix).solve("parallel", use_cache=False, workers=workers) == serial
+    heuristic = [TSP(matrix).solve("parallel", mode="heuristic", use_cache=False, workers=workers)
+                 for workers in (1, 3)]
+    assert heuristic[0] == heuristic[1]
+
+
+def test_solver_thread_reports_unexpected_errors():
+    class BrokenTSP:
+        def solve(self, method, **options):
+            raise RuntimeError("solver crashed")
+
+    app = TSPApp.__new__(TSPApp)  # the worker body needs no window
+    app.solver_queue = queue.Queue()
+    app._run_solver(BrokenTSP(), "held_karp", {})
+    assert app.solver_queue.get_nowait() == ("error", "solver crashed")
@@ -1,34 +1,1092 @@
 import tkinter as tk
-from tkinter import messagebox
-from itertools import permutations
+from tkinter import filedialog, messagebox
+from itertools import chain, islice, permutations
+import hashlib
 import math
+import os
+import queue
+import random
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import Event, Value
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+
+# Held-Karp keeps two (2^(n-1), n-1) tables; refuse instances whose tables exceed this.
+HELD_KARP_MEMORY_LIMIT = 1 << 30  # bytes
+# Largest instance the GUI hands to Held-Karp; bigger ones use budgeted branch-and-bound.
+EXACT_CITY_LIMIT = 18
+# Largest instance the GUI hands to branch-and-bound; bigger ones use the heuristic.
+BRANCH_AND_BOUND_CITY_LIMIT = 40
+SOLVE_TIME_LIMIT = 10.0  # seconds
+# Above this many cities the matrix must come from a file instead of per-cell entries
+MANUAL_ENTRY_LIMIT = 12
+# Cities listed in the solution window before the route is abbreviated
+ROUTE_DISPLAY_LIMIT = 20
+# Candidate list size for the heuristic local search
+NEIGHBOUR_COUNT = 10
+# Number of candidate tours scored per vectorised batch
+EVALUATION_BATCH = 1 << 16
+# Route prefixes parallel exact search splits into, and default heuristic restarts; both are
+# independent of the worker count so the result is too
+PARALLEL_PREFIXES = 64
+PARALLEL_RESTARTS = 8
+# Minimum seconds between progress reports, and between GUI polls of the solver queue
+PROGRESS_INTERVAL = 0.1
+POLL_INTERVAL_MS = 100
+# Solved instances remembered across TSP objects, and how far an edited matrix may
+# drift from a cached one (in changed cells) and still be warm-started from it
+SOLUTION_CACHE_SIZE = 32
+WARM_START_MAX_CELLS = 4
+# Larger matrices are cached by hash only: no copy is kept and they are never warm-started
+WARM_START_MATRIX_BYTES = 1 << 20
+
+
+class SolutionCache:
+    """Thread-safe LRU cache of solved TSP instances keyed by a hash of the matrix contents.
+
+    A copy of each matrix up to WARM_START_MATRIX_BYTES is kept for warm starts, so the
+    cache holds at most maxsize * WARM_START_MATRIX_BYTES of matrix data.
+    """
+
+    def __init__(self, maxsize=SOLUTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.warm_starts = 0
+
+    @staticmethod
+    def matrix_hash(matrix):
+        matrix = np.ascontiguousarray(matrix)
+        digest = hashlib.blake2b(f"{matrix.shape}{matrix.dtype.str}".encode(), digest_size=16)
+        digest.update(memoryview(matrix).cast("B"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached (route, distance, optimal) for key, or None."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry["route"], entry["distance"], entry["optimal"]
+
+    def put(self, key, matrix, route, distance, optimal):
+        method = key[1]
+        copy = np.array(matrix) if matrix.nbytes <= WARM_START_MATRIX_BYTES else None
+        with self.lock:
+            self.entries[key] = {"matrix": copy, "method": method, "route": route,
+                                 "distance": distance, "optimal": optimal}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def nearest(self, matrix, max_cells=WARM_START_MAX_CELLS):
+        """Find the cached instance differing from matrix in the fewest (at most max_cells) cells.
+
+        Returns (route, optimal, old matrix, changed cell indices, method) or None.
+        """
+        if matrix.nbytes > WARM_START_MATRIX_BYTES:
+            return None
+        with self.lock:
+            candidates = [entry for entry in self.entries.values()
+                          if entry["matrix"] is not None and entry["matrix"].shape == matrix.shape]
+        best = None
+        for entry in candidates:
+            changed = np.argwhere(entry["matrix"] != matrix)
+            if len(changed) <= max_cells and (best is None or len(changed) < len(best[3])):
+                best = (entry["route"], entry["optimal"], entry["matrix"], changed, entry["method"])
+        if best is not None:
+            with self.lock:
+                self.warm_starts += 1
+        return best
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {"size": len(self.entries), "maxsize": self.maxsize, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions, "warm_starts": self.warm_starts}
+
 
 class TSP:
-    def __init__(self, distance_matrix):
+    SOLVERS = {
+        "held_karp": "solve_held_karp",
+        "brute_force": "solve_brute_force",
+        "enumeration": "solve_enumeration",
+        "branch_and_bound": "solve_branch_and_bound",
+        "heuristic": "solve_heuristic",
+        "parallel": "solve_parallel",
+    }
+    # Shared by every TSP instance so TSPApp re-solves hit it
+    cache = SolutionCache()
+
+    def __init__(self, distance_matrix, dtype=None):
         self.distance_matrix = distance_matrix
-        self.num_cities = len(distance_matrix)
+        # Dense copy for vectorised work; int16/int32/float32 inputs are kept as-is
+        self.matrix = np.asarray(distance_matrix, dtype=dtype)
+        self.num_cities = len(self.matrix)
+        self._sum_dtype = np.int64 if np.issubdtype(self.matrix.dtype, np.integer) else np.float64
+        # Anytime search state, readable while branch-and-bound is running
+        self.best_route = None
+        self.best_distance = math.inf
+        self.lower_bound = 0
+        self.nodes_explored = 0
+        self.budget_exhausted = False
+        # Heuristic tuning data: improving moves applied and (elapsed seconds, length) points
+        self.iterations = 0
+        self.improvement_timeline = []
+        # Cooperative cancellation and progress reporting for background solves
+        self.cancel_event = threading.Event()
+        self.progress_callback = None
+        self._started = time.monotonic()
+        self._last_report = 0.0
+        # Tour from a cached, slightly different instance used to seed the search
+        self.warm_start_route = None
+        # Per-row array copy of the matrix for the scalar local search, built on first use
+        self._rows = None
+
+    def cancel(self):
+        """Ask a running solve to stop and return the best route found so far."""
+        self.cancel_event.set()
+
+    def _stopping(self, deadline=None, node_limit=None):
+        """True once the search is cancelled or has used up its time or node budget."""
+        if (self.cancel_event.is_set()
+                or (node_limit is not None and self.nodes_explored >= node_limit)
+                or (deadline is not None and time.monotonic() >= deadline)):
+            self.budget_exhausted = True
+        return self.budget_exhausted
+
+    def _report(self, force=False):
+        """Send nodes explored, best distance and elapsed time to progress_callback."""
+        if self.progress_callback is None:
+            return
+        now = time.monotonic()
+        if force or now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            self.progress_callback({"nodes": self.nodes_explored, "best_distance": self.best_distance,
+                                    "elapsed": now - self._started})
+
+    def evaluate_routes(self, routes):
+        """Return the closed-tour length of every row in a (tours, cities) array of routes."""
+        routes = np.asarray(routes, dtype=np.intp)
+        if routes.ndim == 1:
+            routes = routes[np.newaxis, :]
+        # Each leg goes to the next city in the row, with the last one returning to the start
+        legs = self.matrix[routes, np.roll(routes, -1, axis=1)]
+        return legs.sum(axis=1, dtype=self._sum_dtype)
+
+    def distance_rows(self):
+        """Return the matrix as one array('q') or array('d') per row.
+
+        Indexing yields Python numbers, so sums of distances cannot overflow, while
+        each entry still takes only 8 bytes. Rows are widened one at a time.
+        """
+        if self._rows is None:
+            typecode = "q" if self._sum_dtype == np.int64 else "d"
+            self._rows = [array(typecode, row.astype(self._sum_dtype).tobytes()) for row in self.matrix]
+        return self._rows
 
     def calculate_total_distance(self, route):
         """Calculate the total distance of a given route."""
-        total_distance = 0
-        for i in range(len(route) - 1):
-            total_distance += self.distance_matrix[route[i]][route[i + 1]]
-        # Add distance to return to the starting city
-        total_distance += self.distance_matrix[route[-1]][route[0]]
-        return total_distance
-
-    def solve(self):
-        """Solve the TSP using brute force."""
+        return self.evaluate_routes(route)[0].item()
+
+    def solve(self, method="held_karp", use_cache=True, **options):
+        """Solve the TSP and return (best_route, min_distance).
+
+        With use_cache, a repeat of a cached instance returns immediately and an instance
+        a few cells away from a cached one starts from that instance's tour. brute_force
+        is never warm-started, so it stays an independent reference.
+        """
+        if method not in self.SOLVERS:
+            raise ValueError(f"Unknown TSP method '{method}'.")
+        self._started = time.monotonic()
+        self.nodes_explored = 0
+        self.budget_exhausted = False
+        if not use_cache:
+            result = getattr(self, self.SOLVERS[method])(**options)
+            self._report(force=True)
+            return result
+
+        key = (self.cache.matrix_hash(self.matrix), method, tuple(sorted(options.items())))
+        cached = self.cache.get(key)
+        if cached is not None:
+            route, distance, optimal = cached
+            self._record_best(route, distance)
+            self.lower_bound = distance if optimal else 0
+        elif method == "brute_force" or not self._warm_start(method):
+            getattr(self, self.SOLVERS[method])(**options)
+        optimal = not self.budget_exhausted and self.lower_bound >= self.best_distance
+        if cached is None and not self.budget_exhausted:
+            self.cache.put(key, self.matrix, self.best_route, self.best_distance, optimal)
+        self._report(force=True)
+        return self.best_route, self.best_distance
+
+    def _warm_start(self, method):
+        """Seed the search from a nearby cached instance; True if its tour is provably still optimal.
+
+        An optimal tour stays optimal when every distance that went up is off the tour
+        and every distance that went down is on it. Tours cached by a different method
+        only seed the search, so every method still runs its own solver.
+        """
+        nearby = self.cache.nearest(self.matrix)
+        if nearby is None:
+            return False
+        route, optimal, old_matrix, changed, cached_method = nearby
+        self.warm_start_route = route
+        if not optimal or cached_method != method:
+            return False
+        edges = set(zip(route, route[1:] + route[:1]))
+        if self.is_symmetric():
+            edges |= {(j, i) for i, j in edges}
+        for i, j in changed.tolist():
+            if (self.matrix[i, j] > old_matrix[i, j]) == ((i, j) in edges):
+                return False
+        self._record_best(route, self.calculate_total_distance(route))
+        self.lower_bound = self.best_distance
+        return True
+
+    def _seed_route(self):
+        """Starting incumbent: the warm-start tour when it beats a nearest-neighbour tour."""
+        seed = self.nearest_neighbour_route()
+        if (self.warm_start_route is not None
+                and self.calculate_total_distance(self.warm_start_route) < self.calculate_total_distance(seed)):
+            return self.warm_start_route
+        return seed
+
+    def solve_brute_force(self, batch_size=EVALUATION_BATCH):
+        """Solve the TSP using brute force (reference mode for cross-checking)."""
         min_distance = math.inf
         best_route = None
-        # Generate all possible permutations of cities
-        for perm in permutations(range(self.num_cities)):
-            current_distance = self.calculate_total_distance(perm)
-            if current_distance < min_distance:
-                min_distance = current_distance
-                best_route = perm
+        # Generate all possible permutations of cities and score them a batch at a time
+        perms = permutations(range(self.num_cities))
+        while not self._stopping():
+            batch = np.fromiter(chain.from_iterable(islice(perms, batch_size)), dtype=np.intp)
+            if not batch.size:
+                break
+            batch = batch.reshape(-1, self.num_cities)
+            lengths = self.evaluate_routes(batch)
+            best = lengths.argmin()
+            if lengths[best] < min_distance:
+                min_distance = lengths[best].item()
+                best_route = tuple(batch[best].tolist())
+                self._record_best(best_route, min_distance)
+            self.nodes_explored += len(batch)
+            self._report()
         return best_route, min_distance
 
+    def is_symmetric(self):
+        return bool(np.array_equal(self.matrix, self.matrix.T))
+
+    def solve_enumeration(self):
+        """Solve the TSP exactly by enumerating tours from a fixed start with pruning.
+
+        City 0 always starts the tour, a prefix is abandoned as soon as its cost reaches
+        the incumbent, and on symmetric matrices each tour is only built in the direction
+        whose second city is smaller than its last, so mirror images are skipped.
+        """
+        n = self.num_cities
+        seed = self._seed_route()
+        self._record_best(seed, self.calculate_total_distance(seed))
+        if n <= 2:
+            self.lower_bound = self.best_distance
+            return self.best_route, self.best_distance
+        dist = self.distance_rows()
+        symmetric = self.is_symmetric()
+        route = [0]
+        unvisited = set(range(1, n))
+
+        def extend(cost):
+            self.nodes_explored += 1
+            self._report()
+            last = route[-1]
+            if not unvisited:
+                total = cost + dist[last][0]
+                if total < self.best_distance and not (symmetric and route[1] > last):
+                    self._record_best(tuple(route), total)
+                return
+            if symmetric and len(route) > 1 and max(unvisited) < route[1]:
+                return  # every completion would be the mirror of a tour already covered
+            row = dist[last]
+            for city in sorted(unvisited, key=row.__getitem__):
+                if self._stopping():
+                    return
+                new_cost = cost + row[city]
+                if new_cost >= self.best_distance:
+                    break  # cities are sorted by distance, so the rest cost at least as much
+                route.append(city)
+                unvisited.remove(city)
+                extend(new_cost)
+                unvisited.add(city)
+                route.pop()
+
+        extend(0)
+        if not self.budget_exhausted:
+            self.lower_bound = self.best_distance
+        return self.best_route, self.best_distance
+
+    def _dp_dtype(self, matrix):
+        """Pick the smallest DP value type that cannot overflow for this matrix."""
+        if np.issubdtype(matrix.dtype, np.integer):
+            bound = int(matrix.max()) * self.num_cities if matrix.size else 0
+            for dtype in (np.int32, np.int64):
+                if bound < np.iinfo(dtype).max // 4:
+                    return dtype, np.iinfo(dtype).max // 2
+        return np.float64, np.inf
+
+    def solve_held_karp(self, memory_limit=HELD_KARP_MEMORY_LIMIT):
+        """Solve the TSP exactly with the Held-Karp bitmask DP in O(n^2 * 2^n)."""
+        n = self.num_cities
+        if n <= 2:
+            route = tuple(range(n))
+            self._record_best(route, self.calculate_total_distance(route))
+            self.lower_bound = self.best_distance
+            return self.best_route, self.best_distance
+
+        matrix = self.matrix
+        dtype, inf = self._dp_dtype(matrix)
+        m = n - 1  # city 0 is the fixed start; cities 1..n-1 map to bits 0..m-1
+        full = 1 << m
+        table_bytes = full * m * (np.dtype(dtype).itemsize + 1)
+        if table_bytes > memory_limit:
+            raise MemoryError(
+                f"Held-Karp needs {table_bytes / 2**20:.0f} MiB for {n} cities "
+                f"(limit {memory_limit / 2**20:.0f} MiB).")
+
+        # Fallback answer if the solve is cancelled before the tables are complete
+        seed = self._seed_route()
+        self._record_best(seed, self.calculate_total_distance(seed))
+        dist = matrix.astype(dtype)
+        inner = dist[1:, 1:]
+        cost = np.full((full, m), inf, dtype=dtype)
+        parent = np.full((full, m), -1, dtype=np.int8)
+        singles = 1 << np.arange(m)
+        cost[singles, np.arange(m)] = dist[0, 1:]
+
+        masks = np.arange(full)
+        popcount = np.zeros(full, dtype=np.int8)
+        for bit in range(m):
+            popcount += ((masks >> bit) & 1).astype(np.int8)
+
+        for size in range(2, m + 1):
+            layer = masks[popcount == size]
+            for j in range(m):
+                if self._stopping():
+                    return self.best_route, self.best_distance
+                members = layer[(layer >> j) & 1 == 1]
+                previous = members ^ (1 << j)
+                # cost[previous, k] is inf when k is not in the subset, so it never wins
+                candidates = cost[previous] + inner[:, j]
+                best = candidates.argmin(axis=1)
+                cost[members, j] = candidates[np.arange(len(members)), best]
+                parent[members, j] = best
+                self.nodes_explored += len(members)
+                self._report()
+
+        closing = cost[full - 1] + dist[1:, 0]
+        last = int(closing.argmin())
+        route = []
+        mask = full - 1
+        while last >= 0:
+            route.append(last + 1)
+            last, mask = int(parent[mask, last]), mask ^ (1 << last)
+        route.append(0)
+        route.reverse()
+        route = tuple(route)
+        self._record_best(route, self.calculate_total_distance(route))
+        self.lower_bound = self.best_distance
+        return self.best_route, self.best_distance
+
+    def nearest_neighbour_route(self, start=0):
+        """Build a greedy tour that always moves to the closest unvisited city."""
+        visited = np.zeros(self.num_cities, dtype=bool)
+        visited[start] = True
+        route = [start]
+        for _ in range(self.num_cities - 1):
+            row = self.matrix[route[-1]].astype(np.float64)
+            row[visited] = np.inf
+            nearest = int(row.argmin())
+            visited[nearest] = True
+            route.append(nearest)
+        return tuple(route)
+
+    def nearest_neighbours(self, k=NEIGHBOUR_COUNT):
+        """Return, for every city, its k closest other cities sorted by distance."""
+        n = self.num_cities
+        k = min(k, n - 1)
+        if k <= 0:
+            return [[] for _ in range(n)]
+        matrix = self.matrix.astype(np.result_type(self.matrix.dtype, np.float32))
+        np.fill_diagonal(matrix, np.inf)
+        if k < n - 1:
+            candidates = np.argpartition(matrix, k, axis=1)[:, :k]
+        else:
+            candidates = np.tile(np.arange(n), (n, 1))[~np.eye(n, dtype=bool)].reshape(n, n - 1)
+        order = np.take_along_axis(matrix, candidates, axis=1).argsort(axis=1, kind="stable")
+        return np.take_along_axis(candidates, order, axis=1).tolist()
+
+    def greedy_edge_route(self, neighbours=None):
+        """Build a tour by adding the shortest candidate edges that keep it a set of paths.
+
+        Fragments left over once the candidate edges run out are chained together
+        by joining each fragment's tail to the nearest free fragment end.
+        """
+        n = self.num_cities
+        dist = self.distance_rows()
+        if n <= 3:
+            return tuple(range(n))
+        if neighbours is None:
+            neighbours = self.nearest_neighbours()
+        edges = sorted({(min(i, j), max(i, j)) for i in range(n) for j in neighbours[i]},
+                       key=lambda edge: dist[edge[0]][edge[1]])
+        parent = list(range(n))
+
+        def find(city):
+            while parent[city] != city:
+                parent[city] = parent[parent[city]]
+                city = parent[city]
+            return city
+
+        adjacency = [[] for _ in range(n)]
+        for i, j in edges:
+            if len(adjacency[i]) < 2 and len(adjacency[j]) < 2:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[root_i] = root_j
+                    adjacency[i].append(j)
+                    adjacency[j].append(i)
+
+        ends = {city for city in range(n) if len(adjacency[city]) < 2}
+        route = []
+        visited = [False] * n
+        current = min(ends)
+        while True:
+            previous = None
+            while True:
+                route.append(current)
+                visited[current] = True
+                ends.discard(current)
+                following = [city for city in adjacency[current] if city != previous]
+                if not following or visited[following[0]]:
+                    break
+                previous, current = current, following[0]
+            if not ends:
+                break
+            row = dist[current]
+            current = min(ends, key=lambda city: row[city])
+        return tuple(route)
+
+    @staticmethod
+    def _reverse(tour, position, i, j):
+        """Reverse the cyclic stretch of the tour from index i to index j inclusive."""
+        n = len(tour)
+        for _ in range(((j - i) % n + 1) // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            position[b], position[a] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    def _two_opt_move(self, tour, position, city, neighbours):
+        """Apply the first improving 2-opt move around city; return (delta, touched cities)."""
+        dist = self.distance_rows()
+        n = len(tour)
+        at = position[city]
+        for forward in (True, False):
+            other = tour[(at + 1) % n] if forward else tour[at - 1]
+            removed = dist[city][other] if forward else dist[other][city]
+            for candidate in neighbours[city]:
+                added = dist[city][candidate]
+                if added >= removed:
+                    break
+                if forward:
+                    after = tour[(position[candidate] + 1) % n]
+                    if candidate == other or after == city:
+                        continue
+                    delta = added + dist[other][after] - removed - dist[candidate][after]
+                    if delta < -1e-9:
+                        # city->candidate ... other->after
+                        self._reverse_shorter(tour, position, position[other], position[candidate])
+                        return delta, (city, other, candidate, after)
+                else:
+                    before = tour[position[candidate] - 1]
+                    if candidate == other or before == city:
+                        continue
+                    delta = added + dist[before][other] - removed - dist[before][candidate]
+                    if delta < -1e-9:
+                        # before->other ... candidate->city
+                        self._reverse_shorter(tour, position, position[candidate], position[other])
+                        return delta, (city, other, candidate, before)
+        return 0, ()
+
+    def _reverse_shorter(self, tour, position, i, j):
+        """2-opt reversal of tour[i..j], flipping the complement instead when it is shorter."""
+        n = len(tour)
+        if 2 * ((j - i) % n + 1) > n:
+            i, j = (j + 1) % n, (i - 1) % n
+        self._reverse(tour, position, i, j)
+
+    def _or_opt_move(self, tour, position, city, neighbours, max_segment=3, reverse=True):
+        """Move a segment of up to max_segment cities starting at city to a better place.
+
+        With reverse=False the segment keeps its direction, so the delta also holds
+        for asymmetric distances.
+        """
+        dist = self.distance_rows()
+        n = len(tour)
+        start = position[city]
+        for length in range(1, max_segment + 1):
+            if n < length + 3:
+                break
+            segment = [tour[(start + offset) % n] for offset in range(length)]
+            head, tail = segment[0], segment[-1]
+            before, after = tour[start - 1], tour[(start + length) % n]
+            removal_gain = dist[before][head] + dist[tail][after] - dist[before][after]
+            if removal_gain <= 1e-9:
+                continue
+            inside = set(segment)
+            for anchor in neighbours[head] + neighbours[tail]:
+                for left in (anchor, tour[position[anchor] - 1]):
+                    right = tour[(position[left] + 1) % n]
+                    if left in inside or right in inside:
+                        continue
+                    base = dist[left][right]
+                    forward_cost = dist[left][head] + dist[tail][right] - base
+                    reverse_cost = dist[left][tail] + dist[head][right] - base if reverse else math.inf
+                    insert_cost = min(forward_cost, reverse_cost)
+                    if insert_cost < removal_gain - 1e-9:
+                        self._move_segment(tour, position, start, length, left, reverse_cost < forward_cost)
+                        return insert_cost - removal_gain, (before, after, left, right, head, tail)
+        return 0, ()
+
+    def _move_segment(self, tour, position, start, length, left, reverse):
+        """Move tour[start:start+length] (cyclic) to sit right after city left."""
+        n = len(tour)
+        end = (start + length - 1) % n
+        # Swap the segment with whichever neighbouring block is shorter
+        after_span = (position[left] - end) % n
+        before_span = (start - position[left] - 1) % n
+        if after_span <= before_span:
+            block_end = position[left]
+            self._reverse(tour, position, start, end)
+            self._reverse(tour, position, (end + 1) % n, block_end)
+            self._reverse(tour, position, start, block_end)
+            segment_start = (block_end - length + 1) % n
+        else:
+            block_start = (position[left] + 1) % n
+            self._reverse(tour, position, block_start, (start - 1) % n)
+            self._reverse(tour, position, start, end)
+            self._reverse(tour, position, block_start, end)
+            segment_start = block_start
+        if reverse:
+            self._reverse(tour, position, segment_start, (segment_start + length - 1) % n)
+
+    def solve_heuristic(self, construction="greedy", neighbours=NEIGHBOUR_COUNT, or_opt=True, time_limit=None,
+                        start=0):
+        """Approximate the TSP with a constructed tour improved by 2-opt and Or-opt.
+
+        Moves are restricted to each city's nearest-neighbour candidate list and
+        driven by don't-look bits. 2-opt and segment reversal only hold for symmetric
+        distances, so asymmetric matrices get Or-opt moves that keep each segment's
+        direction. start is the first city of the nearest-neighbour construction.
+        """
+        started = time.monotonic()
+        n = self.num_cities
+        self.iterations = 0
+        self.improvement_timeline = []
+        if self.warm_start_route is not None:
+            route = self.warm_start_route
+            candidate_lists = self.nearest_neighbours(neighbours)
+        elif construction == "greedy":
+            candidate_lists = self.nearest_neighbours(neighbours)
+            route = self.greedy_edge_route(candidate_lists)
+        elif construction == "nearest_neighbour":
+            route = self.nearest_neighbour_route(start)
+            candidate_lists = self.nearest_neighbours(neighbours)
+        else:
+            raise ValueError(f"Unknown construction '{construction}'.")
+        length = self.calculate_total_distance(route)
+        self.improvement_timeline.append((time.monotonic() - started, length))
+        if n <= 3:
+            self._record_best(route, length)
+            return route, length
+
+        tour = list(route)
+        position = [0] * n
+        for index, city in enumerate(tour):
+            position[city] = index
+        queue = deque(tour)
+        active = [True] * n
+        symmetric = self.is_symmetric()
+        deadline = None if time_limit is None else started + time_limit
+        while queue:
+            if self._stopping(deadline):
+                break
+            city = queue.popleft()
+            self.nodes_explored += 1
+            self._report()
+            # Every move applied shortens the tour by its exact delta, so the loop always ends
+            delta, touched = 0, ()
+            if symmetric:
+                delta, touched = self._two_opt_move(tour, position, city, candidate_lists)
+            if not touched and (or_opt or not symmetric):
+                delta, touched = self._or_opt_move(tour, position, city, candidate_lists, reverse=symmetric)
+            if not touched:
+                active[city] = False
+                continue
+            length += delta
+            self.iterations += 1
+            self.improvement_timeline.append((time.monotonic() - started, length))
+            for touched_city in (city,) + touched:
+                if not active[touched_city]:
+                    active[touched_city] = True
+                    queue.append(touched_city)
+            if active[city]:
+                queue.appendleft(city)
+
+        zero = position[0]
+        route = tuple(tour[zero:] + tour[:zero])
+        distance = self.calculate_total_distance(route)
+        self._record_best(route, distance)
+        return route, distance
+
+    def gap(self):
+        """Relative gap between the best tour found and the proven lower bound."""
+        if self.best_route is None:
+            return math.inf
+        if self.best_distance == 0:
+            return 0.0
+        return max(0.0, (self.best_distance - self.lower_bound) / self.best_distance)
+
+    def _improves(self, route, distance):
+        """True if (distance, route) beats the incumbent: shorter, or as short and lexicographically smaller."""
+        return self.best_route is None or (distance, tuple(route)) < (self.best_distance, tuple(self.best_route))
+
+    def _record_best(self, route, distance):
+        self.best_route = route
+        self.best_distance = distance
+
+    @staticmethod
+    def _reduce(matrix):
+        """Row/column-reduce a cost matrix in place and return the total reduction."""
+        rows = matrix.min(axis=1)
+        rows[np.isinf(rows)] = 0
+        matrix -= rows[:, None]
+        cols = matrix.min(axis=0)
+        cols[np.isinf(cols)] = 0
+        matrix -= cols
+        return rows.sum() + cols.sum()
+
+    def solve_branch_and_bound(self, time_limit=None, node_limit=None):
+        """Solve the TSP with depth-first branch-and-bound over reduced-matrix bounds.
+
+        On symmetric matrices the search is seeded with the 2-opt/Or-opt tour and its
+        gap is measured against a Held-Karp 1-tree bound; otherwise a nearest-neighbour
+        tour and the reduced-matrix bound are used. The search stops early when
+        time_limit (seconds) or node_limit is reached, returning the best tour so far.
+        """
+        n = self.num_cities
+        seed = self._seed_route()
+        self._record_best(seed, self.calculate_total_distance(seed))
+        if n <= 3:
+            # Every tour on three cities or fewer is a rotation or mirror of the seed
+            if n == 3:
+                mirrored = (0, seed[2], seed[1])
+                distance = self.calculate_total_distance(mirrored)
+                if distance < self.best_distance:
+                    self._record_best(mirrored, distance)
+            self.lower_bound = self.best_distance
+            return self.best_route, self.best_distance
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        if not self._seed_branch_and_bound(deadline):
+            self._branch_and_bound((0,), deadline, node_limit)
+        if not self.budget_exhausted:
+            self.lower_bound = self.best_distance
+        return self.best_route, self.best_distance
+
+    def _seed_branch_and_bound(self, deadline):
+        """Set the starting incumbent and lower bound; True if the incumbent is already proven optimal."""
+        self.lower_bound = 0
+        if self.is_symmetric():
+            incumbent = self.best_route, self.best_distance
+            self.solve_heuristic(time_limit=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if incumbent[1] < self.best_distance:
+                self._record_best(*incumbent)
+            self.lower_bound = self.one_tree_bound(deadline)
+        self.nodes_explored = 0
+        self.budget_exhausted = False
+        return self.lower_bound >= self.best_distance
+
+    @staticmethod
+    def _one_tree(weights):
+        """Length and city degrees of a minimum 1-tree: an MST over cities 1..n-1 plus city 0's two cheapest edges."""
+        n = len(weights)
+        degree = np.zeros(n, dtype=np.int64)
+        in_tree = np.zeros(n, dtype=bool)
+        in_tree[:2] = True
+        key = weights[1].copy()
+        parent = np.ones(n, dtype=np.intp)
+        length = 0.0
+        for _ in range(n - 2):
+            city = int(np.where(in_tree, np.inf, key).argmin())
+            length += key[city]
+            degree[city] += 1
+            degree[parent[city]] += 1
+            in_tree[city] = True
+            closer = ~in_tree & (weights[city] < key)
+            key[closer] = weights[city][closer]
+            parent[closer] = city
+        nearest = np.argpartition(weights[0, 1:], 1)[:2] + 1
+        length += weights[0, nearest].sum()
+        degree[0] = 2
+        degree[nearest] += 1
+        return length, degree
+
+    def one_tree_bound(self, deadline=None, max_iterations=1000):
+        """Held-Karp lower bound for a symmetric matrix, by subgradient ascent on 1-tree city penalties.
+
+        The step is scaled by the gap to the current best distance, so an incumbent
+        should be recorded first. Integer matrices get the bound rounded up.
+        """
+        dist = self.matrix.astype(np.float64)
+        n = self.num_cities
+        penalties = np.zeros(n)
+        bound = -math.inf
+        scale, stalled = 2.0, 0
+        for _ in range(max_iterations):
+            if self.cancel_event.is_set() or (deadline is not None and time.monotonic() >= deadline):
+                break
+            length, degree = self._one_tree(dist + penalties[:, None] + penalties[None, :])
+            value = length - 2 * penalties.sum()
+            if value > bound + 1e-9:
+                bound, stalled = value, 0
+            else:
+                stalled += 1
+                if stalled >= max(n // 2, 5):
+                    scale, stalled = scale / 2, 0
+                    if scale < 1e-4:
+                        break
+            slope = degree - 2
+            norm = int((slope * slope).sum())
+            if norm == 0 or value >= self.best_distance:
+                break  # the 1-tree is a tour, or the incumbent is already proven optimal
+            penalties += scale * (self.best_distance - value) / norm * slope
+        if bound == -math.inf:
+            return 0
+        if np.issubdtype(self.matrix.dtype, np.integer):
+            bound = math.ceil(bound - 1e-6)
+        return min(bound, self.best_distance)
+
+    def _root_reduced_matrix(self):
+        """Return the float distance matrix and its reduced copy with the reduction bound."""
+        dist = self.matrix.astype(np.float64)
+        root = dist.copy()
+        np.fill_diagonal(root, np.inf)
+        return dist, root, self._reduce(root)
+
+    def _branch(self, reduced, bound, last, city):
+        """Reduced matrix and lower bound after extending a partial route with last->city."""
+        child = reduced.copy()
+        child[last, :] = np.inf
+        child[:, city] = np.inf
+        child[city, 0] = np.inf
+        return child, bound + reduced[last, city] + self._reduce(child)
+
+    def _branch_and_bound(self, prefix, deadline=None, node_limit=None, shared_bound=None):
+        """Depth-first search over every tour that starts with prefix, improving the incumbent.
+
+        shared_bound is an optional multiprocessing.Value holding the best length found by any
+        worker; subtrees whose bound strictly exceeds it are pruned. Subtrees that can only
+        tie the incumbent are still searched, so the search ends on the lexicographically
+        smallest of the shortest tours however the work was split.
+        """
+        n = self.num_cities
+        dist, reduced, bound = self._root_reduced_matrix()
+        root = prefix == (0,)
+        if root:
+            self.lower_bound = max(self.lower_bound, min(bound, self.best_distance))
+        cost = 0
+        for last, city in zip(prefix, prefix[1:]):
+            reduced, bound = self._branch(reduced, bound, last, city)
+            cost += dist[last, city]
+
+        def pruned(value):
+            return value > self.best_distance or (shared_bound is not None and value > shared_bound.value)
+
+        # Each entry: (bound, reduced matrix, path so far, exact cost of the path)
+        stack = [(bound, reduced, prefix, cost)]
+        while stack:
+            if self._stopping(deadline, node_limit):
+                break
+            bound, reduced, path, cost = stack.pop()
+            if pruned(bound):
+                continue
+            self.nodes_explored += 1
+            self._report()
+            last = path[-1]
+            if len(path) == n:
+                total = cost + dist[last, 0]
+                if not pruned(total) and self._improves(path, self.calculate_total_distance(path)):
+                    self._record_best(path, self.calculate_total_distance(path))
+                    if shared_bound is not None:
+                        with shared_bound.get_lock():
+                            shared_bound.value = min(shared_bound.value, total)
+                continue
+            children = []
+            for city in np.flatnonzero(np.isfinite(reduced[last])):
+                city = int(city)
+                child_path = path + (city,)
+                child_cost = cost + dist[last, city]
+                if len(child_path) == n:
+                    child_bound = child_cost + dist[city, 0]
+                    child = reduced
+                else:
+                    child, child_bound = self._branch(reduced, bound, last, city)
+                if not pruned(child_bound):
+                    children.append((child_bound, child, child_path, child_cost))
+            # Push the most promising child last so it is explored first
+            children.sort(key=lambda entry: entry[0], reverse=True)
+            stack.extend(children)
+        if root and stack:
+            # Every unexplored tour lies below an open node, so the weakest open bound still holds
+            open_bound = min(entry[0] for entry in stack)
+            self.lower_bound = max(self.lower_bound, min(open_bound, self.best_distance))
+
+    def _route_prefixes(self, count):
+        """Enumerate fixed-start route prefixes, deep enough to yield at least count of them."""
+        prefixes = [(0,)]
+        while len(prefixes) < count and len(prefixes[0]) < self.num_cities - 1:
+            prefixes = [prefix + (city,) for prefix in prefixes
+                        for city in range(1, self.num_cities) if city not in prefix]
+        return prefixes
+
+    def solve_parallel(self, mode="exact", workers=None, restarts=None, seed=0, time_limit=None):
+        """Solve the TSP on a process pool that reads the matrix from shared memory.
+
+        mode="exact" splits branch-and-bound by route prefix with a shared best bound;
+        mode="heuristic" runs independent local-search restarts (restart 0 is greedy-edge,
+        the rest start nearest-neighbour from a city drawn from seed). The work split does
+        not depend on workers and equal lengths go to the lexicographically smallest
+        route, so within the time limit the tour is the same for any worker count, and
+        exact mode returns the same tour as solve_branch_and_bound.
+        """
+        workers = workers or os.cpu_count() or 1
+        n = self.num_cities
+        if mode == "exact":
+            if n <= 4:
+                return self.solve_branch_and_bound(time_limit=time_limit)
+            tasks = self._route_prefixes(PARALLEL_PREFIXES)
+            task = _exact_task
+        elif mode == "heuristic":
+            tasks = [seed + restart for restart in range(restarts or PARALLEL_RESTARTS)]
+            task = _heuristic_task
+        else:
+            raise ValueError(f"Unknown parallel mode '{mode}'.")
+
+        seed_route = self._seed_route()
+        self._record_best(seed_route, self.calculate_total_distance(seed_route))
+        started = time.monotonic()
+        # Start from the serial search's incumbent and bound so both end on the same tour
+        if mode == "exact" and self._seed_branch_and_bound(None if time_limit is None else started + time_limit):
+            self.lower_bound = self.best_distance
+            return self.best_route, self.best_distance
+        if time_limit is not None:
+            time_limit -= time.monotonic() - started
+        self.nodes_explored = 0
+        self.budget_exhausted = False
+        deadline = None if time_limit is None else time.time() + time_limit
+        matrix = np.ascontiguousarray(self.matrix)
+        shared = SharedMemory(create=True, size=max(matrix.nbytes, 1))
+        try:
+            np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shared.buf)[...] = matrix
+            shared_bound = Value("d", float(self.best_distance))
+            cancel = Event()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(shared.name, matrix.shape, matrix.dtype.str, shared_bound,
+                                               cancel)) as pool:
+                futures = [pool.submit(task, item, seed, deadline) for item in tasks]
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=PROGRESS_INTERVAL)
+                    self.nodes_explored += sum(future.result()[2] for future in done)
+                    if self.cancel_event.is_set():
+                        cancel.set()
+                    self._report()
+                results = [future.result() for future in futures]
+        finally:
+            shared.close()
+            shared.unlink()
+
+        # nodes_explored already holds the running total reported while waiting
+        for route, distance, nodes, exhausted in results:
+            self.budget_exhausted = self.budget_exhausted or exhausted
+            if route is not None and self._improves(route, distance):
+                self._record_best(route, distance)
+        if mode == "exact" and not self.budget_exhausted:
+            self.lower_bound = self.best_distance
+        return self.best_route, self.best_distance
+
+
+def distances_from_coordinates(coordinates, dtype=np.float64):
+    """Build a Euclidean distance matrix from an (n, 2) array of city coordinates.
+
+    Integer dtypes round to the nearest whole distance, as TSPLIB's EUC_2D does.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise ValueError("Coordinates must be an (n, 2) array of x, y pairs.")
+    x, y = coordinates[:, 0], coordinates[:, 1]
+    dx = x[:, np.newaxis] - x[np.newaxis, :]
+    dy = y[:, np.newaxis] - y[np.newaxis, :]
+    distances = np.hypot(dx, dy, out=dx)
+    if np.issubdtype(np.dtype(dtype), np.integer):
+        distances = np.floor(distances + 0.5, out=distances)
+    return distances.astype(dtype, copy=False)
+
+
+def _compact(matrix):
+    """Store whole-number float matrices as int32 when the values fit."""
+    if matrix.size and np.all(matrix == np.floor(matrix)) and np.abs(matrix).max() < 2 ** 31:
+        return matrix.astype(np.int32)
+    return matrix
+
+
+def _check_square(matrix, path):
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1] or matrix.shape[0] < 2:
+        raise ValueError(f"'{os.path.basename(path)}' does not hold a square distance matrix.")
+    return matrix
+
+
+def load_distance_matrix(path):
+    """Load a distance matrix from a .npy, TSPLIB (.tsp/.atsp) or CSV file.
+
+    .npy files are memory-mapped read-only instead of being read into memory.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        matrix = np.load(path, mmap_mode="r")
+    elif extension in (".tsp", ".atsp"):
+        matrix = load_tsplib(path)
+    else:
+        matrix = _compact(np.loadtxt(path, delimiter=",", ndmin=2))
+    return _check_square(matrix, path)
+
+
+def load_coordinates(path, dtype=np.float64):
+    """Load (n, 2) city coordinates from a .npy or CSV file and return their distance matrix."""
+    if os.path.splitext(path)[1].lower() == ".npy":
+        coordinates = np.load(path)
+    else:
+        coordinates = np.loadtxt(path, delimiter=",", ndmin=2)
+    return _check_square(distances_from_coordinates(coordinates, dtype), path)
+
+
+def load_tsplib(path):
+    """Read a TSPLIB instance with EUC_2D, CEIL_2D, ATT or EXPLICIT edge weights."""
+    spec = {}
+    sections = {}
+    current = None
+    with open(path) as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line == "EOF":
+                continue
+            if ":" in line:
+                key, value = line.split(":", 1)
+                spec[key.strip().upper()] = value.strip()
+                current = None
+            elif line.upper().endswith("_SECTION"):
+                current = sections.setdefault(line.upper(), [])
+            elif current is not None:
+                current.extend(float(token) for token in line.split())
+
+    n = int(spec.get("DIMENSION", 0))
+    weight_type = spec.get("EDGE_WEIGHT_TYPE", "").upper()
+    if weight_type in ("EUC_2D", "CEIL_2D", "ATT"):
+        coordinates = np.array(sections.get("NODE_COORD_SECTION", []), dtype=np.float64).reshape(-1, 3)[:, 1:]
+        if weight_type == "EUC_2D":
+            return distances_from_coordinates(coordinates, np.int32)
+        distances = distances_from_coordinates(coordinates)
+        if weight_type == "CEIL_2D":
+            return np.ceil(distances).astype(np.int32)
+        # ATT pseudo-Euclidean distance, rounded up whenever the nearest integer is too small
+        scaled = distances / math.sqrt(10.0)
+        rounded = np.floor(scaled + 0.5)
+        return (rounded + (rounded < scaled)).astype(np.int32)
+    if weight_type != "EXPLICIT":
+        raise ValueError(f"Unsupported TSPLIB edge weight type '{weight_type}'.")
+
+    weights = np.array(sections.get("EDGE_WEIGHT_SECTION", []), dtype=np.float64)
+    weight_format = spec.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper()
+    if weight_format == "FULL_MATRIX":
+        return _compact(weights.reshape(n, n))
+    triangles = {
+        "UPPER_ROW": np.triu_indices(n, 1),
+        "LOWER_ROW": np.tril_indices(n, -1),
+        "UPPER_DIAG_ROW": np.triu_indices(n),
+        "LOWER_DIAG_ROW": np.tril_indices(n),
+    }
+    if weight_format not in triangles:
+        raise ValueError(f"Unsupported TSPLIB edge weight format '{weight_format}'.")
+    matrix = np.zeros((n, n))
+    rows, cols = triangles[weight_format]
+    matrix[rows, cols] = weights
+    matrix[cols, rows] = weights
+    return _compact(matrix)
+
+
+# Per-process state for solve_parallel workers
+_worker = {}
+
+
+def _init_worker(shared_name, shape, dtype, shared_bound, cancel):
+    shared = SharedMemory(name=shared_name)
+    _worker["shared"] = shared  # keep the mapping alive for the life of the worker
+    _worker["matrix"] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shared.buf)
+    _worker["bound"] = shared_bound
+    _worker["cancel"] = cancel
+
+
+def _worker_tsp():
+    tsp = TSP(_worker["matrix"])
+    tsp.cancel_event = _worker["cancel"]
+    return tsp
+
+
+def _remaining(deadline):
+    return None if deadline is None else max(0.0, deadline - time.time())
+
+
+def _exact_task(prefix, seed, deadline):
+    tsp = _worker_tsp()
+    remaining = _remaining(deadline)
+    tsp._branch_and_bound(prefix, None if remaining is None else time.monotonic() + remaining,
+                          shared_bound=_worker["bound"])
+    return tsp.best_route, tsp.best_distance, tsp.nodes_explored, tsp.budget_exhausted
+
+
+def _heuristic_task(restart, seed, deadline):
+    tsp = _worker_tsp()
+    if restart == seed:
+        route, distance = tsp.solve_heuristic(time_limit=_remaining(deadline))
+    else:
+        start = random.Random(restart).randrange(tsp.num_cities)
+        route, distance = tsp.solve_heuristic("nearest_neighbour", time_limit=_remaining(deadline), start=start)
+    return route, distance, tsp.iterations, False
+
 
 class TSPApp:
     def __init__(self, root, main_app):
@@ -36,6 +1094,13 @@ class TSPApp:
         self.main_app = main_app
         self.distance_matrix = []
         self.num_cities = 0
+        self.entries = []
+        self.matrix_frame = None
+        self.solve_button = None
+        # Background solve state: the running TSP and the queue its worker thread reports into
+        self.tsp = None
+        self.solver_queue = queue.Queue()
+        self.poll_id = None
 
         self.root.title("Traveling Salesman Problem")
         self.root.geometry("500x400")
@@ -51,6 +1116,14 @@ class TSPApp:
         self.submit_button = tk.Button(root, text="Submit", command=self.submit_cities, font=("Arial", 12))
         self.submit_button.pack(pady=5)
 
+        # Bulk input from files, for instances too large to type in
+        self.load_matrix_button = tk.Button(root, text="Load Matrix File", command=self.load_matrix_file, font=("Arial", 12))
+        self.load_matrix_button.pack(pady=5)
+
+        self.load_coordinates_button = tk.Button(root, text="Load Coordinates File", command=self.load_coordinates_file,
+                                                 font=("Arial", 12))
+        self.load_coordinates_button.pack(pady=5)
+
         # Back Button
         self.back_button = tk.Button(root, text="Back", font=("Arial", 12), command=self.go_back)
         self.back_button.pack(pady=5)
@@ -60,16 +1133,66 @@ class TSPApp:
             self.num_cities = int(self.entry_cities.get())
             if self.num_cities < 2:
                 raise ValueError
-            self.show_distance_matrix_input()
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid number of cities (at least 2).")
+            return
+        if self.num_cities > MANUAL_ENTRY_LIMIT:
+            messagebox.showerror("Error", f"For more than {MANUAL_ENTRY_LIMIT} cities, load the distances from a file.")
+            return
+        self.show_distance_matrix_input()
+
+    def load_matrix_file(self):
+        path = filedialog.askopenfilename(title="Load Distance Matrix",
+                                          filetypes=[("Distance matrices", "*.csv *.txt *.npy *.tsp *.atsp"),
+                                                     ("All files", "*.*")])
+        if path:
+            self._load(load_distance_matrix, path)
+
+    def load_coordinates_file(self):
+        path = filedialog.askopenfilename(title="Load City Coordinates",
+                                          filetypes=[("Coordinates", "*.csv *.txt *.npy"), ("All files", "*.*")])
+        if path:
+            self._load(load_coordinates, path)
+
+    def _load(self, loader, path):
+        try:
+            matrix = loader(path)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"Could not load '{os.path.basename(path)}': {error}")
+            return
+        self.distance_matrix = matrix
+        self.num_cities = len(matrix)
+        self.show_matrix_summary(os.path.basename(path))
+
+    def _reset_matrix_frame(self):
+        if self.matrix_frame is not None:
+            self.matrix_frame.destroy()
+        self.matrix_frame = tk.Frame(self.root, bg='#3498db')
+        self.matrix_frame.pack(pady=10)
+        self.entries = []
+        if self.solve_button is None:
+            self.solve_button = tk.Button(self.root, text="Solve TSP", font=("Arial", 12), command=self.solve_tsp)
+            self.solve_button.pack(pady=10)
+            self.cancel_button = tk.Button(self.root, text="Cancel", font=("Arial", 12), command=self.cancel_solve,
+                                           state='disabled')
+            self.cancel_button.pack(pady=5)
+            self.progress_label = tk.Label(self.root, text="", font=("Arial", 12), bg='#3498db', fg='white')
+            self.progress_label.pack(pady=5)
+
+    def show_matrix_summary(self, source):
+        """Describe a loaded matrix in a single label instead of one entry per cell."""
+        self._reset_matrix_frame()
+        matrix = self.distance_matrix
+        off_diagonal = matrix[~np.eye(self.num_cities, dtype=bool)] if self.num_cities <= 2000 else matrix[0, 1:]
+        summary = (f"Loaded {source}\n{self.num_cities} cities, {matrix.dtype} distances\n"
+                   f"Distance range: {off_diagonal.min()} - {off_diagonal.max()}")
+        tk.Label(self.matrix_frame, text=summary, font=("Arial", 12), bg='#3498db', fg='white').pack()
 
     def show_distance_matrix_input(self):
         self.entry_cities.config(state='disabled')
         self.submit_button.config(state='disabled')
 
-        self.matrix_frame = tk.Frame(self.root, bg='#3498db')
-        self.matrix_frame.pack(pady=10)
+        self._reset_matrix_frame()
 
         self.labels = []
         self.entries = []
@@ -84,30 +1207,97 @@ class TSPApp:
                 row.append(entry)
             self.entries.append(row)
 
-        self.solve_button = tk.Button(self.root, text="Solve TSP", font=("Arial", 12), command=self.solve_tsp)
-        self.solve_button.pack(pady=10)
-
     def solve_tsp(self):
         try:
-            # Create the distance matrix from the user input
-            self.distance_matrix = [
-                [int(self.entries[i][j].get()) for j in range(self.num_cities)]
-                for i in range(self.num_cities)
-            ]
-            tsp = TSP(self.distance_matrix)
-            best_route, min_distance = tsp.solve()
-            self.show_solution(best_route, min_distance)
+            if self.entries:
+                # Create the distance matrix from the user input
+                self.distance_matrix = [
+                    [int(self.entries[i][j].get()) for j in range(self.num_cities)]
+                    for i in range(self.num_cities)
+                ]
         except ValueError:
             messagebox.showerror("Error", "Please enter valid distances for all cities.")
+            return
+        if self.num_cities <= EXACT_CITY_LIMIT:
+            method, options = "held_karp", {}
+        elif self.num_cities <= BRANCH_AND_BOUND_CITY_LIMIT:
+            method, options = "branch_and_bound", {"time_limit": SOLVE_TIME_LIMIT}
+        else:
+            method, options = "heuristic", {"time_limit": SOLVE_TIME_LIMIT}
+
+        self.tsp = TSP(self.distance_matrix)
+        self.tsp.progress_callback = lambda progress: self.solver_queue.put(("progress", progress))
+        self.solve_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        self.progress_label.config(text="Solving...")
+        worker = threading.Thread(target=self._run_solver, args=(self.tsp, method, options), daemon=True)
+        worker.start()
+        self.poll_id = self.root.after(POLL_INTERVAL_MS, self._poll_solver)
+
+    def _run_solver(self, tsp, method, options):
+        """Worker thread body: never touches Tk, only posts results to solver_queue."""
+        try:
+            best_route, min_distance = tsp.solve(method, **options)
+        except Exception as error:
+            # Anything uncaught would end the thread silently and leave the window waiting forever
+            self.solver_queue.put(("error", str(error) or type(error).__name__))
+            return
+        if method == "heuristic" or (method == "held_karp" and tsp.budget_exhausted):
+            gap = None
+        else:
+            gap = tsp.gap()
+        self.solver_queue.put(("done", (best_route, min_distance, gap)))
+
+    def _poll_solver(self):
+        """Drain progress messages from the worker and reschedule until it finishes."""
+        try:
+            while True:
+                kind, payload = self.solver_queue.get_nowait()
+                if kind == "progress":
+                    self.progress_label.config(
+                        text=f"Explored {payload['nodes']:,} nodes | Best distance: {payload['best_distance']} | "
+                             f"{payload['elapsed']:.1f}s")
+                    continue
+                self.tsp = None
+                self.poll_id = None
+                self.solve_button.config(state='normal')
+                self.cancel_button.config(state='disabled')
+                if kind == "error":
+                    self.progress_label.config(text="")
+                    messagebox.showerror("Error", payload)
+                else:
+                    stats = TSP.cache.stats()
+                    self.progress_label.config(
+                        text=f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+                             f"{stats['warm_starts']} warm starts, {stats['evictions']} evictions")
+                    self.show_solution(*payload)
+                return
+        except queue.Empty:
+            pass
+        self.poll_id = self.root.after(POLL_INTERVAL_MS, self._poll_solver)
+
+    def cancel_solve(self):
+        if self.tsp is not None:
+            self.tsp.cancel()
+            self.progress_label.config(text="Cancelling...")
 
-    def show_solution(self, best_route, min_distance):
+    def show_solution(self, best_route, min_distance, gap=0.0):
+        """Show the route; gap is 0 for a proven optimum and None when no bound is known."""
         result_window = tk.Toplevel(self.root)
         result_window.title("TSP Solution")
         result_window.geometry("400x300")
         result_window.config(bg='#2ecc71')
 
-        route_str = " -> ".join(f"City {city}" for city in best_route)
-        result_label = tk.Label(result_window, text=f"Optimal Route: {route_str}\nTotal Distance: {min_distance}",
+        route_str = " -> ".join(f"City {city}" for city in best_route[:ROUTE_DISPLAY_LIMIT])
+        if len(best_route) > ROUTE_DISPLAY_LIMIT:
+            route_str += f" -> ... ({len(best_route)} cities)"
+        if gap is None:
+            text = f"Best Route Found: {route_str}\nTotal Distance: {min_distance}"
+        elif gap > 0:
+            text = f"Best Route Found: {route_str}\nTotal Distance: {min_distance}\nGap to lower bound: {gap:.1%}"
+        else:
+            text = f"Optimal Route: {route_str}\nTotal Distance: {min_distance}"
+        result_label = tk.Label(result_window, text=text, wraplength=380,
                                 font=("Arial", 14), bg='#2ecc71', fg='white')
         result_label.pack(pady=20)
 
@@ -115,5 +1305,10 @@ class TSPApp:
         close_button.pack(pady=10)
 
     def go_back(self):
+        if self.tsp is not None:
+            self.tsp.cancel()
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
         self.root.destroy()
         self.main_app.deiconify()
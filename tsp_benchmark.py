@@ -0,0 +1,54 @@
+"""Benchmark the pruned TSP enumeration against the brute-force reference.
+
+Run with ``python tsp_benchmark.py`` to print, for n = 8..12, how many tours brute
+force scores (n!) against how many search nodes the fixed-start, mirror-skipping,
+cost-pruned enumeration expands.
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from tsp_app import TSP, distances_from_coordinates
+
+
+def random_instance(num_cities, seed):
+    """Symmetric integer distances between random cities on a 1000 x 1000 grid."""
+    rng = np.random.default_rng(seed)
+    return distances_from_coordinates(rng.uniform(0, 1000, size=(num_cities, 2)), np.int32)
+
+
+def timed_solve(matrix, method):
+    tsp = TSP(matrix)
+    started = time.perf_counter()
+    route, distance = tsp.solve(method, use_cache=False)
+    return distance, tsp.nodes_explored, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-cities", type=int, default=8)
+    parser.add_argument("--max-cities", type=int, default=12)
+    parser.add_argument("--brute-force-limit", type=int, default=10,
+                        help="largest instance actually run through brute force")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'n':>3} {'brute-force tours':>18} {'enumeration nodes':>18} {'reduction':>10} "
+          f"{'brute (s)':>10} {'enum (s)':>9}")
+    for num_cities in range(args.min_cities, args.max_cities + 1):
+        matrix = random_instance(num_cities, args.seed + num_cities)
+        distance, nodes, enum_seconds = timed_solve(matrix, "enumeration")
+        tours = math.factorial(num_cities)
+        brute_seconds = "-"
+        if num_cities <= args.brute_force_limit:
+            brute_distance, _, seconds = timed_solve(matrix, "brute_force")
+            assert brute_distance == distance, (brute_distance, distance)
+            brute_seconds = f"{seconds:.2f}"
+        print(f"{num_cities:>3} {tours:>18,} {nodes:>18,} {tours / nodes:>9.0f}x "
+              f"{brute_seconds:>10} {enum_seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()